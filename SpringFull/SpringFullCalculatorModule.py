@@ -326,6 +326,7 @@ class DatabaseManager:
         self.localized_materials = {}  # Données traduites des matériaux
         self.base_path = None
         self.loaded = False
+        self.generation = 0  # Incrémenté à chaque chargement (invalide les caches externes)
     
     def find_database_folder(self):
         """Recherche le dossier contenant les fichiers JSON (dans utils/)."""
@@ -475,6 +476,7 @@ class DatabaseManager:
                 self.end_types_data = data
         
         self.loaded = True
+        self.generation += 1
         return True
     
     def get_localized_material(self, name):
@@ -14,6 +14,7 @@ try:
     from PySide6 import QtCore
     from PySide6 import QtWidgets as QtGui  # Alias pour compatibilité avec le code existant
     from PySide6.QtWidgets import QMessageBox, QDialog
+    from PySide6.QtGui import QStandardItemModel, QStandardItem
     # PySide6: les constantes sont dans des sous-classes
     QMsgBoxOk = QMessageBox.StandardButton.Ok
     QMsgBoxYes = QMessageBox.StandardButton.Yes
@@ -25,6 +26,7 @@ except ImportError:
     from PySide import QtCore
     from PySide import QtGui
     from PySide.QtWidgets import QMessageBox, QDialog
+    from PySide.QtGui import QStandardItemModel, QStandardItem
     # PySide2: les constantes sont directement sur les classes
     QMsgBoxOk = QMessageBox.Ok
     QMsgBoxYes = QMessageBox.Yes
@@ -33,8 +35,138 @@ except ImportError:
     QDialogAccepted = QDialog.Accepted
     PYSIDE6 = False
 
+import re
+from functools import lru_cache, partial
+
 # Import du module d'internationalisation
-from SpringFull.SpringFullI18nModule import tr
+from SpringFull.SpringFullI18nModule import tr, get_current_language, LABELS
+
+
+# Termes reconnus dans les configurations stockées (toutes langues supportées)
+# FR: libre | EN: free | DE: frei | ES: libre | IT: libera
+_FREE_TERMS = frozenset(("libre", "free", "frei", "libera"))
+# FR: bloc | EN: solid | DE: block | ES: bloque | IT: blocco
+_SOLID_TERMS = frozenset(("bloc", "solid", "block", "bloque", "blocco"))
+# FR: charge définie | EN: custom load/force | DE: benutzerdefinierte last
+# ES: carga personalizada | IT: carico personalizzato
+_FORCE_TERMS = frozenset(("charge definie", "custom load", "custom force", "defined load",
+                          "benutzerdefinierte last", "carga personalizada", "carico personalizzato"))
+# FR: hauteur définie | EN: custom height | DE: benutzerdefinierte höhe
+# ES: altura personalizada | IT: altezza personalizzata
+_HEIGHT_TERMS = frozenset(("hauteur", "height", "höhe", "altura", "altezza",
+                           "personnalis", "custom", "benutzerdefiniert", "personaliza"))
+
+
+def _terms_group(kind, terms):
+    """Groupe nommé d'alternance de termes (les plus longs d'abord)."""
+    alternatives = sorted(terms, key=len, reverse=True)
+    return f"(?P<{kind}>{'|'.join(map(re.escape, alternatives))})"
+
+
+# Classification en une seule passe; l'ordre des groupes donne la priorité
+# à position égale: libre > bloc > charge définie > hauteur définie
+_CLASSIFY_RE = re.compile("|".join((
+    _terms_group("free", _FREE_TERMS),
+    _terms_group("solid", _SOLID_TERMS),
+    _terms_group("force", _FORCE_TERMS),
+    _terms_group("height", _HEIGHT_TERMS),
+)))
+
+# Valeur numérique dans une configuration ("Custom height (45.00 mm)")
+_NUM_RE = re.compile(r'[\d.,]+')
+# Séparateur décimal français -> point
+_COMMA_TO_DOT = str.maketrans(',', '.')
+
+
+def _parse_num(config_str):
+    """Retourne la première valeur numérique de config_str (0.0 si absente)."""
+    match = _NUM_RE.search(config_str)
+    return float(match.group().translate(_COMMA_TO_DOT)) if match else 0.0
+
+
+def _format_custom_config(key, config_str):
+    """Formate une configuration personnalisée avec la valeur lue dans config_str."""
+    return tr(key).format(_parse_num(config_str))
+
+
+# Traduction de la configuration selon le groupe reconnu par _CLASSIFY_RE
+_CONFIG_HANDLERS = {
+    "free": lambda config_str: tr("repr.config_free"),
+    "solid": lambda config_str: tr("repr.config_solid"),
+    "force": lambda config_str: _format_custom_config("repr.config_custom_force", config_str),
+    "height": lambda config_str: _format_custom_config("repr.config_custom_height", config_str),
+}
+
+
+@lru_cache(maxsize=64)
+def _module_G(material, generation):
+    """Module G (daN/mm²) d'un matériau, mémorisé par génération de la base DB."""
+    from SpringFull.SpringFullCalculatorModule import DB
+    if DB.loaded:
+        return DB.get_module_G(material)
+    return 8150  # Valeur par défaut pour acier (daN/mm²)
+
+
+def _get_G(material):
+    """Retourne le module G du matériau (8150 daN/mm² si la base est indisponible)."""
+    try:
+        from SpringFull.SpringFullCalculatorModule import DB
+        return _module_G(material, DB.generation)
+    except:
+        return 8150  # Valeur par défaut
+
+
+# Gabarits HTML des messages (centrés par l'alignement des QLabel)
+_ITALIC = "<i>{}</i>"
+_CURRENT_REPR = "{} <font size=+1><b>{}</b></font>"
+
+
+def _set_message_text(msgBox, text):
+    """Texte principal d'un QMessageBox, format explicite (texte brut sans balise)."""
+    msgBox.setTextFormat(QtCore.Qt.RichText if "<" in text else QtCore.Qt.PlainText)
+    msgBox.setText(text)
+
+
+# Délai (ms) sans survol avant de cadrer la vue sur le ressort survolé
+_VIEW_SELECTION_DELAY_MS = 150
+
+# Configurations déjà traduites: {(config_stockée, langue): (texte traduit, type)}
+_CONFIG_CACHE = {}
+
+
+def _translate_config(config_str):
+    """Traduit une configuration stockée vers la langue courante.
+    
+    Retourne (texte traduit, type) avec type parmi
+    'free', 'solid', 'force', 'height', 'loaded'.
+    
+    Reconnaît les termes dans toutes les langues supportées:
+    - FR: libre, bloc, sous charge, hauteur définie, charge définie
+    - EN: free, solid, loaded, custom height, custom load/force
+    - DE: frei, block, belastet, benutzerdefiniert
+    - ES: libre, bloque, bajo carga, personalizada
+    - IT: libera, blocco, sotto carico, personalizzata
+    """
+    if not config_str:
+        return tr("repr.config_loaded"), "loaded"
+    match = _CLASSIFY_RE.search(config_str.lower())
+    if match:
+        kind = match.lastgroup
+        return _CONFIG_HANDLERS[kind](config_str), kind
+    
+    # === LOADED SPRING (default) ===
+    # FR: sous charge | EN: loaded | DE: belastet | ES: bajo carga | IT: sotto carico
+    # Si rien d'autre ne correspond, c'est probablement "loaded"
+    return tr("repr.config_loaded"), "loaded"
+
+
+def _cached_config(config_str):
+    """Retourne (traduction, type) mémorisés d'une configuration (calculés au premier appel)."""
+    key = (config_str, get_current_language())
+    result = _CONFIG_CACHE.get(key)
+    if result is None:
+        result = _CONFIG_CACHE[key] = _translate_config(config_str)
+    return result
 
 
 def dialogSpringCreated(spring_name):
@@ -46,8 +178,8 @@ def dialogSpringCreated(spring_name):
     """
     msgBox = QtGui.QMessageBox()
     msgBox.setWindowTitle(tr("dlg.spring_created_title"))
-    msgBox.setText(f"<center>{tr('dlg.spring_created_msg').format(name=spring_name)}</center>")
-    msgBox.setInformativeText(f"<center>{tr('dlg.spring_created_info')}</center>")
+    _set_message_text(msgBox, tr('dlg.spring_created_msg').format(name=spring_name))
+    msgBox.setInformativeText(tr('dlg.spring_created_info'))
     msgBox.setStandardButtons(QMsgBoxOk)
     msgBox.exec()
 
@@ -62,8 +194,8 @@ def dialogMissingProperties(count, body_name):
     """
     msgBox = QtGui.QMessageBox()
     msgBox.setWindowTitle(tr("dlg.props_init_title"))
-    msgBox.setText(f"<center>{tr('dlg.props_init_msg').format(count=count, name=body_name)}</center>")
-    msgBox.setInformativeText(f"<center>{tr('dlg.props_init_info')}</center>")
+    _set_message_text(msgBox, tr('dlg.props_init_msg').format(count=count, name=body_name))
+    msgBox.setInformativeText(tr('dlg.props_init_info'))
     msgBox.setStandardButtons(QMsgBoxOk)
     msgBox.exec()
 
@@ -74,11 +206,308 @@ def dialogInitialSaveAlert():
     """
     msgBox = QtGui.QMessageBox()
     msgBox.setWindowTitle(tr("dlg.save_required_title"))
-    msgBox.setText(f"<center>{tr('dlg.save_required_msg')}</center>")
+    _set_message_text(msgBox, tr('dlg.save_required_msg'))
     msgBox.setStandardButtons(QMsgBoxOk)
     msgBox.exec()
 
 
+class _ConfigurationDialog(QtGui.QDialog):
+    """
+    Dialogue de configuration de la représentation (construit une seule fois).
+    
+    Les widgets sont créés à la construction; populate() ne fait que
+    remettre à jour les valeurs dépendant du ressort avant chaque ouverture.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.language = get_current_language()
+        
+        self.setWindowTitle(tr("repr.window_title"))
+        self.setMinimumWidth(480)
+        
+        layout = QtGui.QVBoxLayout()
+        # Pas de relayout pendant la construction (un seul passage à l'affichage)
+        layout.setEnabled(False)
+        
+        # Titre
+        title = QtGui.QLabel(tr("repr.title"))
+        title.setAlignment(QtCore.Qt.AlignCenter)
+        title.setStyleSheet("font-weight: bold; font-size: 12pt;")
+        layout.addWidget(title)
+        
+        # Configuration actuelle
+        self.current_label = QtGui.QLabel()
+        self.current_label.setAlignment(QtCore.Qt.AlignCenter)
+        layout.addWidget(self.current_label)
+        
+        # Info sur les hauteurs
+        self.info_label = QtGui.QLabel()
+        self.info_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.info_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.info_label)
+        
+        layout.addSpacing(15)
+        
+        # === GROUPE TYPE DE REPRÉSENTATION ===
+        config_group = QtGui.QGroupBox(tr("repr.type_group"))
+        config_layout = QtGui.QVBoxLayout()
+        
+        self.radio_libre = QtGui.QRadioButton()
+        self.radio_sous_charge = QtGui.QRadioButton()
+        self.radio_bloc = QtGui.QRadioButton()
+        
+        # Option hauteur personnalisée
+        self.radio_custom = QtGui.QRadioButton(tr("repr.custom_height"))
+        
+        # Layout horizontal pour le spinbox hauteur
+        custom_layout = QtGui.QHBoxLayout()
+        custom_layout.addSpacing(25)  # Indentation
+        self.spin_custom = QtGui.QDoubleSpinBox()
+        self.spin_custom.setDecimals(2)
+        self.spin_custom.setSingleStep(1.0)
+        self.spin_custom.setSuffix(" mm")
+        self.spin_custom.setMinimumWidth(120)
+        self.spin_custom.setEnabled(False)  # Désactivé par défaut
+        custom_layout.addWidget(self.spin_custom)
+        custom_layout.addStretch()
+        
+        # Option charge personnalisée
+        self.radio_custom_force = QtGui.QRadioButton(tr("repr.custom_force"))
+        
+        # Layout horizontal pour le spinbox charge
+        custom_force_layout = QtGui.QHBoxLayout()
+        custom_force_layout.addSpacing(25)  # Indentation
+        self.spin_custom_force = QtGui.QDoubleSpinBox()
+        self.spin_custom_force.setDecimals(2)
+        self.spin_custom_force.setSingleStep(1.0)
+        self.spin_custom_force.setSuffix(" daN")
+        self.spin_custom_force.setMinimumWidth(120)
+        self.spin_custom_force.setEnabled(False)  # Désactivé par défaut
+        custom_force_layout.addWidget(self.spin_custom_force)
+        custom_force_layout.addStretch()
+        
+        # Bouton correspondant à chaque type de configuration (cf. _translate_config)
+        self._radio_by_kind = {
+            "free": self.radio_libre,
+            "solid": self.radio_bloc,
+            "force": self.radio_custom_force,
+            "height": self.radio_custom,
+            "loaded": self.radio_sous_charge,
+        }
+        
+        # Connecter les signaux pour activer/désactiver les spinbox
+        for radio in (self.radio_libre, self.radio_sous_charge, self.radio_bloc,
+                      self.radio_custom, self.radio_custom_force):
+            radio.toggled.connect(self._on_radio_changed)
+        
+        # Liaison charge <-> hauteur
+        self.spin_custom.valueChanged.connect(self._on_height_changed)
+        self.spin_custom_force.valueChanged.connect(self._on_force_changed)
+        
+        config_layout.addWidget(self.radio_libre)
+        config_layout.addWidget(self.radio_sous_charge)
+        config_layout.addWidget(self.radio_bloc)
+        config_layout.addWidget(self.radio_custom)
+        config_layout.addLayout(custom_layout)
+        config_layout.addSpacing(5)
+        config_layout.addWidget(self.radio_custom_force)
+        config_layout.addLayout(custom_force_layout)
+        config_group.setLayout(config_layout)
+        layout.addWidget(config_group)
+        
+        layout.addSpacing(10)
+        
+        # === GROUPE MODE SIMPLIFIÉ ===
+        simplified_group = QtGui.QGroupBox(tr("repr.mode_group"))
+        simplified_layout = QtGui.QVBoxLayout()
+        
+        self.checkbox_detailed = QtGui.QCheckBox(tr("repr.detailed"))
+        self.checkbox_detailed.setToolTip(tr("repr.detailed_tooltip"))
+        
+        simplified_layout.addWidget(self.checkbox_detailed)
+        simplified_group.setLayout(simplified_layout)
+        layout.addWidget(simplified_group)
+        
+        layout.addSpacing(20)
+        
+        # === BOUTONS ===
+        button_layout = QtGui.QHBoxLayout()
+        ok_button = QtGui.QPushButton(LABELS.ok)
+        cancel_button = QtGui.QPushButton(LABELS.cancel)
+        
+        ok_button.clicked.connect(self.accept)
+        cancel_button.clicked.connect(self.reject)
+        
+        button_layout.addStretch()
+        button_layout.addWidget(ok_button)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+        
+        layout.setEnabled(True)
+        self.setLayout(layout)
+    
+    def populate(self, data):
+        """Met à jour les valeurs affichées pour le ressort data."""
+        self.setUpdatesEnabled(False)
+        try:
+            # Configuration actuelle - traduire si nécessaire
+            current_config_raw = getattr(data, 'configuration', "")
+            
+            current_config, config_kind = _cached_config(current_config_raw)
+            self.current_label.setText(tr("repr.current") + " <b>" + current_config + "</b>")
+            
+            # Lecture unique des propriétés du ressort (relues plusieurs fois ensuite)
+            self.H = H = data.onLoadHight
+            self.Lc_max = Lc_max = data.minHeight
+            snap = {
+                'freeLength': getattr(data, 'freeLength', None),
+                'solidHeight': getattr(data, 'solidHeight', None),
+                'wireDiameter': getattr(data, 'wireDiameter', 4.0),
+                'meanDiameter': getattr(data, 'meanDiameter', 20.0),
+                'activeTurnsQty': getattr(data, 'activeTurnsQty', 7.0),
+                'material': getattr(data, 'material', 'CORDE A PIANO'),
+                'customHeight': getattr(data, 'customHeight', 0.0),
+                'customForce': getattr(data, 'customForce', 0.0),
+            }
+            
+            # Info sur les hauteurs
+            L0 = snap['freeLength']
+            if L0 is None:
+                L0 = H + 20
+            self.L0 = L0
+            
+            # Longueur spires jointes (solidHeight)
+            Lc_min = snap['solidHeight']
+            if Lc_min is None:
+                Lc_min = Lc_max * 0.8
+            self.Lc_min = Lc_min
+            
+            # Récupérer les données pour calculer la raideur
+            d = snap['wireDiameter']
+            Dm = snap['meanDiameter']
+            n = snap['activeTurnsQty']
+            
+            # Récupérer le module G depuis la base de données ou utiliser une valeur par défaut
+            material = snap['material']
+            
+            G = _get_G(material)
+            
+            # Calculer la raideur: R = (G × d⁴) / (8 × Dm³ × n) en daN/mm
+            if Dm > 0 and n > 0:
+                spring_rate = (G * (d ** 4)) / (8 * (Dm ** 3) * n)
+            else:
+                spring_rate = 1.0
+            self.spring_rate = spring_rate
+            # Inverse de la raideur (0 si raideur nulle): H = L0 - F × inv_k
+            self.inv_k = 1.0 / spring_rate if spring_rate > 0 else 0.0
+            
+            # Calculer la force nominale (à H sous charge)
+            # F = R × (L0 - H)
+            self.F_nominal = F_nominal = spring_rate * (L0 - H) if L0 > H else 0
+            
+            # Calculer la force max (à Lc_min - spires jointes)
+            self.F_max = F_max = spring_rate * (L0 - Lc_min) if L0 > Lc_min else F_nominal * 2
+            
+            # Hauteur personnalisée précédente (si définie et valide)
+            # Valeur par défaut = H (hauteur sous charge)
+            stored_height = snap['customHeight']
+            stored_force = snap['customForce']
+            
+            previous_custom = stored_height
+            if previous_custom <= 0 or previous_custom < Lc_min or previous_custom > L0:
+                previous_custom = H  # Valeur par défaut = hauteur sous charge
+            
+            # S'assurer que les valeurs sont synchronisées si aucune n'a été définie
+            # (première utilisation ou valeurs non initialisées)
+            if stored_height <= 0 and stored_force <= 0:
+                # Aucune valeur stockée: utiliser H (charge nominale correspondante)
+                previous_custom = H
+            elif stored_force > 0 and stored_height <= 0:
+                # Charge stockée mais pas la hauteur: calculer la hauteur correspondante
+                previous_custom = L0 - stored_force / spring_rate if spring_rate > 0 else H
+                if previous_custom < Lc_min:
+                    previous_custom = Lc_min
+                if previous_custom > L0:
+                    previous_custom = L0
+            
+            info_text = _ITALIC.format(tr("repr.info_heights").format(L0=L0, H=H, Lc=Lc_max))
+            self.info_label.setText(info_text)
+            
+            self.radio_libre.setText(tr("repr.free").format(L0=L0))
+            self.radio_sous_charge.setText(tr("repr.loaded").format(H=H))
+            self.radio_bloc.setText(tr("repr.solid").format(Lc=Lc_max))
+            
+            # Sélection selon le type de la configuration actuelle
+            self._radio_by_kind[config_kind].setChecked(True)
+            self._on_radio_changed()
+            
+            # === SYNCHRONISATION INITIALE ===
+            # Recalculer les valeurs initiales basées sur les données actuelles du ressort
+            # La hauteur personnalisée par défaut est H (sous charge)
+            initial_height = previous_custom if previous_custom >= Lc_min and previous_custom <= L0 else H
+            initial_force = spring_rate * (L0 - initial_height) if spring_rate > 0 else F_nominal
+            
+            # Borner les valeurs
+            if initial_force < 0:
+                initial_force = 0
+            if initial_force > F_max:
+                initial_force = F_max
+            
+            # Mettre à jour les spinbox sans déclencher les callbacks
+            with QtCore.QSignalBlocker(self.spin_custom), QtCore.QSignalBlocker(self.spin_custom_force):
+                self.spin_custom.setRange(Lc_min, L0)  # Entre longueur spires jointes et longueur libre
+                self.spin_custom_force.setRange(0, F_max)  # Entre 0 et force max
+                self.spin_custom.setValue(initial_height)
+                self.spin_custom_force.setValue(initial_force)
+            
+            # État actuel (par défaut simplifié)
+            simplified = getattr(data, 'simplified', True)
+            self.checkbox_detailed.setChecked(not simplified)
+        finally:
+            # Réactivé même en cas d'erreur (le dialogue est réutilisé)
+            self.setUpdatesEnabled(True)
+    
+    def _on_radio_changed(self):
+        self.spin_custom.setEnabled(self.radio_custom.isChecked())
+        self.spin_custom_force.setEnabled(self.radio_custom_force.isChecked())
+    
+    # Liaison charge <-> hauteur: la mise à jour du spinbox lié est faite
+    # signaux bloqués, pour ne pas rappeler le callback symétrique
+    def _on_height_changed(self, value):
+        # Calculer la force correspondante: F = k * (L0 - H)
+        force = self.spring_rate * (self.L0 - value)
+        if force < 0:
+            force = 0
+        if force > self.F_max:
+            force = self.F_max
+        with QtCore.QSignalBlocker(self.spin_custom_force):
+            self.spin_custom_force.setValue(force)
+    
+    def _on_force_changed(self, value):
+        # Calculer la hauteur correspondante: H = L0 - F/k (H = L0 si k nulle)
+        L0 = self.L0
+        height = L0 - value * self.inv_k
+        if height < self.Lc_min:
+            height = self.Lc_min
+        if height > L0:
+            height = L0
+        with QtCore.QSignalBlocker(self.spin_custom):
+            self.spin_custom.setValue(height)
+
+
+# Dialogue de configuration réutilisé d'une ouverture à l'autre
+_config_dialog = None
+
+
+def _get_configuration_dialog():
+    """Retourne le dialogue de configuration (reconstruit si la langue a changé)."""
+    global _config_dialog
+    if _config_dialog is None or _config_dialog.language != get_current_language():
+        _config_dialog = _ConfigurationDialog()
+    return _config_dialog
+
+
 def configuration(data):
     """
     Dialogue de configuration de la représentation du ressort.
@@ -102,343 +531,8 @@ def configuration(data):
         - turnsPitch: pas des spires actives
         - config_name: nom de la configuration choisie
     """
-    dialog = QtGui.QDialog()
-    dialog.setWindowTitle(tr("repr.window_title"))
-    dialog.setMinimumWidth(480)
-    
-    layout = QtGui.QVBoxLayout()
-    
-    # Titre
-    title = QtGui.QLabel(tr("repr.title"))
-    title.setAlignment(QtCore.Qt.AlignCenter)
-    title.setStyleSheet("font-weight: bold; font-size: 12pt;")
-    layout.addWidget(title)
-    
-    # Configuration actuelle - traduire si nécessaire
-    current_config_raw = getattr(data, 'configuration', "")
-    
-    # Fonction pour traduire une configuration stockée
-    def translate_config(config_str):
-        """Traduit une configuration stockée vers la langue courante.
-        
-        Reconnaît les termes dans toutes les langues supportées:
-        - FR: libre, bloc, sous charge, hauteur définie, charge définie
-        - EN: free, solid, loaded, custom height, custom load/force
-        - DE: frei, block, belastet, benutzerdefiniert
-        - ES: libre, bloque, bajo carga, personalizada
-        - IT: libera, blocco, sotto carico, personalizzata
-        """
-        if not config_str:
-            return tr("repr.config_loaded")
-        config_lower = config_str.lower()
-        
-        # === FREE SPRING ===
-        # FR: libre | EN: free | DE: frei | ES: libre | IT: libera
-        free_terms = ["libre", "free", "frei", "libera"]
-        if any(term in config_lower for term in free_terms):
-            return tr("repr.config_free")
-        
-        # === SOLID HEIGHT ===
-        # FR: bloc | EN: solid | DE: block | ES: bloque | IT: blocco
-        solid_terms = ["bloc", "solid", "block", "bloque", "blocco"]
-        if any(term in config_lower for term in solid_terms):
-            return tr("repr.config_solid")
-        
-        # === CUSTOM FORCE/LOAD ===
-        # FR: charge définie | EN: custom load/force | DE: benutzerdefinierte last
-        # ES: carga personalizada | IT: carico personalizzato
-        force_terms = ["charge definie", "custom load", "custom force", "defined load",
-                       "benutzerdefinierte last", "carga personalizada", "carico personalizzato"]
-        if any(term in config_lower for term in force_terms):
-            import re
-            match = re.search(r'[\d.,]+', config_str)
-            if match:
-                value = float(match.group().replace(',', '.'))
-                return tr("repr.config_custom_force").format(value)
-            return tr("repr.config_custom_force").format(0)
-        
-        # === CUSTOM HEIGHT ===
-        # FR: hauteur définie | EN: custom height | DE: benutzerdefinierte höhe
-        # ES: altura personalizada | IT: altezza personalizzata
-        height_terms = ["hauteur", "height", "höhe", "altura", "altezza", 
-                        "personnalis", "custom", "benutzerdefiniert", "personaliza"]
-        if any(term in config_lower for term in height_terms):
-            import re
-            match = re.search(r'[\d.,]+', config_str)
-            if match:
-                value = float(match.group().replace(',', '.'))
-                return tr("repr.config_custom_height").format(value)
-            return tr("repr.config_custom_height").format(0)
-        
-        # === LOADED SPRING (default) ===
-        # FR: sous charge | EN: loaded | DE: belastet | ES: bajo carga | IT: sotto carico
-        # Si rien d'autre ne correspond, c'est probablement "loaded"
-        return tr("repr.config_loaded")
-    
-    current_config = translate_config(current_config_raw)
-    current_label = QtGui.QLabel(tr("repr.current") + " <b>" + current_config + "</b>")
-    current_label.setAlignment(QtCore.Qt.AlignCenter)
-    layout.addWidget(current_label)
-    
-    # Info sur les hauteurs
-    L0 = getattr(data, 'freeLength', data.onLoadHight + 20)
-    H = data.onLoadHight
-    Lc_max = data.minHeight
-    
-    # Longueur spires jointes (solidHeight)
-    Lc_min = getattr(data, 'solidHeight', Lc_max * 0.8)
-    
-    # Récupérer les données pour calculer la raideur
-    d = getattr(data, 'wireDiameter', 4.0)
-    Dm = getattr(data, 'meanDiameter', 20.0)
-    n = getattr(data, 'activeTurnsQty', 7.0)
-    
-    # Récupérer le module G depuis la base de données ou utiliser une valeur par défaut
-    material = getattr(data, 'material', 'CORDE A PIANO')
-    
-    # Importer DB pour obtenir le module G
-    try:
-        from SpringFull.SpringFullCalculatorModule import DB
-        if DB.loaded:
-            G = DB.get_module_G(material)
-        else:
-            G = 8150  # Valeur par défaut pour acier (daN/mm²)
-    except:
-        G = 8150  # Valeur par défaut
-    
-    # Calculer la raideur: R = (G × d⁴) / (8 × Dm³ × n) en daN/mm
-    if Dm > 0 and n > 0:
-        spring_rate = (G * (d ** 4)) / (8 * (Dm ** 3) * n)
-    else:
-        spring_rate = 1.0
-    
-    # Calculer la force nominale (à H sous charge)
-    # F = R × (L0 - H)
-    F_nominal = spring_rate * (L0 - H) if L0 > H else 0
-    
-    # Calculer la force max (à Lc_min - spires jointes)
-    F_max = spring_rate * (L0 - Lc_min) if L0 > Lc_min else F_nominal * 2
-    
-    # Hauteur personnalisée précédente (si définie et valide)
-    # Valeur par défaut = H (hauteur sous charge)
-    previous_custom = getattr(data, 'customHeight', 0.0)
-    if previous_custom <= 0 or previous_custom < Lc_min or previous_custom > L0:
-        previous_custom = H  # Valeur par défaut = hauteur sous charge
-    
-    # Charge personnalisée précédente (si définie et valide)
-    # Valeur par défaut = F_nominal (charge nominale à H)
-    previous_custom_force = getattr(data, 'customForce', 0.0)
-    if previous_custom_force <= 0:
-        previous_custom_force = F_nominal  # Valeur par défaut = charge nominale
-    if previous_custom_force > F_max:
-        previous_custom_force = F_max
-    
-    # S'assurer que les valeurs sont synchronisées si aucune n'a été définie
-    # (première utilisation ou valeurs non initialisées)
-    stored_height = getattr(data, 'customHeight', 0.0)
-    stored_force = getattr(data, 'customForce', 0.0)
-    
-    if stored_height <= 0 and stored_force <= 0:
-        # Aucune valeur stockée: utiliser H et F_nominal (synchronisés)
-        previous_custom = H
-        previous_custom_force = F_nominal
-    elif stored_height > 0 and stored_force <= 0:
-        # Hauteur stockée mais pas la charge: calculer la charge correspondante
-        previous_custom_force = spring_rate * (L0 - previous_custom) if spring_rate > 0 else F_nominal
-    elif stored_force > 0 and stored_height <= 0:
-        # Charge stockée mais pas la hauteur: calculer la hauteur correspondante
-        previous_custom = L0 - stored_force / spring_rate if spring_rate > 0 else H
-        if previous_custom < Lc_min:
-            previous_custom = Lc_min
-        if previous_custom > L0:
-            previous_custom = L0
-    
-    info_text = "<i>" + tr("repr.info_heights").format(L0=L0, H=H, Lc=Lc_max) + "</i>"
-    info_label = QtGui.QLabel(info_text)
-    info_label.setAlignment(QtCore.Qt.AlignCenter)
-    info_label.setStyleSheet("color: #666;")
-    layout.addWidget(info_label)
-    
-    layout.addSpacing(15)
-    
-    # === GROUPE TYPE DE REPRÉSENTATION ===
-    config_group = QtGui.QGroupBox(tr("repr.type_group"))
-    config_layout = QtGui.QVBoxLayout()
-    
-    radio_libre = QtGui.QRadioButton(tr("repr.free").format(L0=L0))
-    radio_sous_charge = QtGui.QRadioButton(tr("repr.loaded").format(H=H))
-    radio_bloc = QtGui.QRadioButton(tr("repr.solid").format(Lc=Lc_max))
-    
-    # Option hauteur personnalisée
-    radio_custom = QtGui.QRadioButton(tr("repr.custom_height"))
-    
-    # Layout horizontal pour le spinbox hauteur
-    custom_layout = QtGui.QHBoxLayout()
-    custom_layout.addSpacing(25)  # Indentation
-    spin_custom = QtGui.QDoubleSpinBox()
-    spin_custom.setRange(Lc_min, L0)  # Entre longueur spires jointes et longueur libre
-    spin_custom.setDecimals(2)
-    spin_custom.setSingleStep(1.0)
-    spin_custom.setValue(previous_custom)  # Valeur précédente ou H par défaut
-    spin_custom.setSuffix(" mm")
-    spin_custom.setMinimumWidth(120)
-    spin_custom.setEnabled(False)  # Désactivé par défaut
-    custom_layout.addWidget(spin_custom)
-    custom_layout.addStretch()
-    
-    # Option charge personnalisée
-    radio_custom_force = QtGui.QRadioButton(tr("repr.custom_force"))
-    
-    # Layout horizontal pour le spinbox charge
-    custom_force_layout = QtGui.QHBoxLayout()
-    custom_force_layout.addSpacing(25)  # Indentation
-    spin_custom_force = QtGui.QDoubleSpinBox()
-    spin_custom_force.setRange(0, F_max)  # Entre 0 et force max
-    spin_custom_force.setDecimals(2)
-    spin_custom_force.setSingleStep(1.0)
-    spin_custom_force.setValue(previous_custom_force)
-    spin_custom_force.setSuffix(" daN")
-    spin_custom_force.setMinimumWidth(120)
-    spin_custom_force.setEnabled(False)  # Désactivé par défaut
-    custom_force_layout.addWidget(spin_custom_force)
-    custom_force_layout.addStretch()
-    
-    # Variable pour éviter les boucles infinies lors de la mise à jour
-    updating_values = [False]
-    
-    # Sélection selon configuration actuelle (utilise current_config qui est déjà traduit)
-    # On compare avec les termes de la langue courante
-    config_lower = current_config.lower()
-    
-    # Termes pour chaque type dans toutes les langues
-    free_terms = ["libre", "free", "frei", "libera"]
-    solid_terms = ["bloc", "solid", "block", "bloque", "blocco"]
-    force_terms = ["charge", "force", "load", "last", "carga", "carico"]
-    height_terms = ["hauteur", "height", "höhe", "altura", "altezza"]
-    
-    if any(term in config_lower for term in free_terms):
-        radio_libre.setChecked(True)
-    elif any(term in config_lower for term in solid_terms):
-        radio_bloc.setChecked(True)
-    elif any(term in config_lower for term in force_terms) and "personnalis" not in config_lower:
-        # Force/charge définie (mais pas "sous charge")
-        if any(term in config_lower for term in ["definie", "custom", "defined", "benutzerdefiniert", "personaliza"]):
-            radio_custom_force.setChecked(True)
-            spin_custom_force.setEnabled(True)
-        else:
-            radio_sous_charge.setChecked(True)
-    elif any(term in config_lower for term in height_terms) or "personnalis" in config_lower or "custom" in config_lower or "benutzerdefiniert" in config_lower:
-        radio_custom.setChecked(True)
-        spin_custom.setEnabled(True)
-    else:
-        radio_sous_charge.setChecked(True)
-    
-    # Connecter les signaux pour activer/désactiver les spinbox
-    def on_radio_changed():
-        spin_custom.setEnabled(radio_custom.isChecked())
-        spin_custom_force.setEnabled(radio_custom_force.isChecked())
-    
-    # Liaison charge <-> hauteur
-    def on_height_changed(value):
-        if updating_values[0]:
-            return
-        updating_values[0] = True
-        # Calculer la force correspondante: F = k * (L0 - H)
-        force = spring_rate * (L0 - value)
-        if force < 0:
-            force = 0
-        if force > F_max:
-            force = F_max
-        spin_custom_force.setValue(force)
-        updating_values[0] = False
-    
-    def on_force_changed(value):
-        if updating_values[0]:
-            return
-        updating_values[0] = True
-        # Calculer la hauteur correspondante: H = L0 - F/k
-        if spring_rate > 0:
-            height = L0 - value / spring_rate
-        else:
-            height = L0
-        if height < Lc_min:
-            height = Lc_min
-        if height > L0:
-            height = L0
-        spin_custom.setValue(height)
-        updating_values[0] = False
-    
-    radio_libre.toggled.connect(on_radio_changed)
-    radio_sous_charge.toggled.connect(on_radio_changed)
-    radio_bloc.toggled.connect(on_radio_changed)
-    radio_custom.toggled.connect(on_radio_changed)
-    radio_custom_force.toggled.connect(on_radio_changed)
-    
-    spin_custom.valueChanged.connect(on_height_changed)
-    spin_custom_force.valueChanged.connect(on_force_changed)
-    
-    # === SYNCHRONISATION INITIALE ===
-    # Recalculer les valeurs initiales basées sur les données actuelles du ressort
-    # La hauteur personnalisée par défaut est H (sous charge)
-    initial_height = previous_custom if previous_custom >= Lc_min and previous_custom <= L0 else H
-    initial_force = spring_rate * (L0 - initial_height) if spring_rate > 0 else F_nominal
-    
-    # Borner les valeurs
-    if initial_force < 0:
-        initial_force = 0
-    if initial_force > F_max:
-        initial_force = F_max
-    
-    # Mettre à jour les spinbox sans déclencher les callbacks
-    updating_values[0] = True
-    spin_custom.setValue(initial_height)
-    spin_custom_force.setValue(initial_force)
-    updating_values[0] = False
-    
-    config_layout.addWidget(radio_libre)
-    config_layout.addWidget(radio_sous_charge)
-    config_layout.addWidget(radio_bloc)
-    config_layout.addWidget(radio_custom)
-    config_layout.addLayout(custom_layout)
-    config_layout.addSpacing(5)
-    config_layout.addWidget(radio_custom_force)
-    config_layout.addLayout(custom_force_layout)
-    config_group.setLayout(config_layout)
-    layout.addWidget(config_group)
-    
-    layout.addSpacing(10)
-    
-    # === GROUPE MODE SIMPLIFIÉ ===
-    simplified_group = QtGui.QGroupBox(tr("repr.mode_group"))
-    simplified_layout = QtGui.QVBoxLayout()
-    
-    checkbox_detailed = QtGui.QCheckBox(tr("repr.detailed"))
-    checkbox_detailed.setToolTip(tr("repr.detailed_tooltip"))
-    
-    # État actuel (par défaut simplifié)
-    simplified = getattr(data, 'simplified', True)
-    checkbox_detailed.setChecked(not simplified)
-    
-    simplified_layout.addWidget(checkbox_detailed)
-    simplified_group.setLayout(simplified_layout)
-    layout.addWidget(simplified_group)
-    
-    layout.addSpacing(20)
-    
-    # === BOUTONS ===
-    button_layout = QtGui.QHBoxLayout()
-    ok_button = QtGui.QPushButton(tr("common.ok"))
-    cancel_button = QtGui.QPushButton(tr("common.cancel"))
-    
-    ok_button.clicked.connect(dialog.accept)
-    cancel_button.clicked.connect(dialog.reject)
-    
-    button_layout.addStretch()
-    button_layout.addWidget(ok_button)
-    button_layout.addWidget(cancel_button)
-    layout.addLayout(button_layout)
-    
-    dialog.setLayout(layout)
+    dialog = _get_configuration_dialog()
+    dialog.populate(data)
     
     # Exécution
     result = dialog.exec()
@@ -447,6 +541,10 @@ def configuration(data):
         # CORRECTION v1.3: Utiliser directement les hauteurs stockées
         # - displayHeight = position du LCS Top
         # - displayActiveTurnsHight = hauteur des spires actives (pour calcul du pas)
+        L0 = dialog.L0
+        H = dialog.H
+        Lc_min = dialog.Lc_min
+        spring_rate = dialog.spring_rate
         
         d = data.wireDiameter
         nm = data.deadTurnsQty
@@ -460,17 +558,17 @@ def configuration(data):
         if not is_ground and hasattr(data, 'extremeTurns'):
             is_ground = "MEULEES" in data.extremeTurns.upper()
         
-        if radio_libre.isChecked():
+        if dialog.radio_libre.isChecked():
             # Mode libre: LCS à L0
             displayHeight = L0
             config_name = tr("repr.config_free")
-        elif radio_bloc.isChecked():
+        elif dialog.radio_bloc.isChecked():
             # Mode bloc: LCS à Lc_max
-            displayHeight = Lc_max
+            displayHeight = dialog.Lc_max
             config_name = tr("repr.config_solid")
-        elif radio_custom.isChecked():
+        elif dialog.radio_custom.isChecked():
             # Mode hauteur personnalisée
-            displayHeight = spin_custom.value()
+            displayHeight = dialog.spin_custom.value()
             config_name = tr("repr.config_custom_height").format(displayHeight)
             # Sauvegarder les deux valeurs synchronisées pour la prochaine fois
             data.customHeight = displayHeight
@@ -478,10 +576,10 @@ def configuration(data):
             if spring_rate > 0:
                 data.customForce = spring_rate * (L0 - displayHeight)
             else:
-                data.customForce = F_nominal
-        elif radio_custom_force.isChecked():
+                data.customForce = dialog.F_nominal
+        elif dialog.radio_custom_force.isChecked():
             # Mode charge personnalisée
-            custom_force = spin_custom_force.value()
+            custom_force = dialog.spin_custom_force.value()
             # Calculer la hauteur correspondante
             if spring_rate > 0:
                 displayHeight = L0 - custom_force / spring_rate
@@ -510,7 +608,7 @@ def configuration(data):
             displayActiveTurnsHight = displayHeight - deadTurnsHightTotal - d
         
         # Mode simplifié (inversé: checkbox cochée = détaillé = NOT simplified)
-        data.simplified = not checkbox_detailed.isChecked()
+        data.simplified = not dialog.checkbox_detailed.isChecked()
         
         # Mettre à jour la configuration (c'est juste le nom, pas les données de calcul)
         data.configuration = config_name
@@ -552,12 +650,14 @@ def springUpdateDialog(data, piece, on_recalculate_callback=None):
     dialog.setMinimumWidth(500)
     
     layout = QtGui.QVBoxLayout()
+    layout.setEnabled(False)
     
     # Message principal - entièrement traduit
     message = QtGui.QLabel(
-        f"<center>{tr('update.main_msg').format(name=piece.Label.upper(), action=msg)}</center>"
+        tr('update.main_msg').format(name=piece.Label.upper(), action=msg)
     )
     message.setWordWrap(True)
+    message.setAlignment(QtCore.Qt.AlignCenter)
     layout.addWidget(message)
     
     layout.addSpacing(10)
@@ -565,66 +665,19 @@ def springUpdateDialog(data, piece, on_recalculate_callback=None):
     # Configuration actuelle - traduire si nécessaire
     config_raw = getattr(data, 'configuration', "")
     
-    def translate_config(config_str):
-        """Traduit une configuration stockée vers la langue courante.
-        
-        Reconnaît les termes dans toutes les langues supportées:
-        - FR: libre, bloc, sous charge, hauteur définie, charge définie
-        - EN: free, solid, loaded, custom height, custom load/force
-        - DE: frei, block, belastet, benutzerdefiniert
-        - ES: libre, bloque, bajo carga, personalizada
-        - IT: libera, blocco, sotto carico, personalizzata
-        """
-        if not config_str:
-            return tr("repr.config_loaded")
-        config_lower = config_str.lower()
-        
-        # === FREE SPRING ===
-        free_terms = ["libre", "free", "frei", "libera"]
-        if any(term in config_lower for term in free_terms):
-            return tr("repr.config_free")
-        
-        # === SOLID HEIGHT ===
-        solid_terms = ["bloc", "solid", "block", "bloque", "blocco"]
-        if any(term in config_lower for term in solid_terms):
-            return tr("repr.config_solid")
-        
-        # === CUSTOM FORCE/LOAD ===
-        force_terms = ["charge definie", "custom load", "custom force", "defined load",
-                       "benutzerdefinierte last", "carga personalizada", "carico personalizzato"]
-        if any(term in config_lower for term in force_terms):
-            import re
-            match = re.search(r'[\d.,]+', config_str)
-            if match:
-                value = float(match.group().replace(',', '.'))
-                return tr("repr.config_custom_force").format(value)
-            return tr("repr.config_custom_force").format(0)
-        
-        # === CUSTOM HEIGHT ===
-        height_terms = ["hauteur", "height", "höhe", "altura", "altezza", 
-                        "personnalis", "custom", "benutzerdefiniert", "personaliza"]
-        if any(term in config_lower for term in height_terms):
-            import re
-            match = re.search(r'[\d.,]+', config_str)
-            if match:
-                value = float(match.group().replace(',', '.'))
-                return tr("repr.config_custom_height").format(value)
-            return tr("repr.config_custom_height").format(0)
-        
-        # === LOADED SPRING (default) ===
-        return tr("repr.config_loaded")
-    
-    config_text = translate_config(config_raw)
+    config_text = _cached_config(config_raw)[0]
     config_label = QtGui.QLabel(
-        f"<center>{tr('update.current_repr')} <font size=+1><b>{config_text}</b></font></center>"
+        _CURRENT_REPR.format(tr('update.current_repr'), config_text)
     )
+    config_label.setAlignment(QtCore.Qt.AlignCenter)
     layout.addWidget(config_label)
     
     # Info H sous charge
     h_sous_charge = getattr(data, 'onLoadHight', 0)
     h_label = QtGui.QLabel(
-        f"<center><i>{tr('update.h_label').format(H=h_sous_charge)}</i></center>"
+        _ITALIC.format(tr('update.h_label').format(H=h_sous_charge))
     )
+    h_label.setAlignment(QtCore.Qt.AlignCenter)
     h_label.setStyleSheet("color: #666;")
     layout.addWidget(h_label)
     
@@ -635,7 +688,11 @@ def springUpdateDialog(data, piece, on_recalculate_callback=None):
     
     # Bouton Recalculer (remplace "Éditer données" -> LibreOffice)
     recalc_button = QtGui.QPushButton("🔢 " + tr("update.btn_recalc"))
-    recalc_button.setToolTip(tr("update.btn_recalc_tooltip") if tr("update.btn_recalc_tooltip") != "update.btn_recalc_tooltip" else "Ouvrir le calculateur de ressort pour modifier les paramètres")
+    recalc_tooltip = tr("update.btn_recalc_tooltip")
+    if recalc_tooltip == "update.btn_recalc_tooltip":
+        # Clé absente des traductions
+        recalc_tooltip = "Ouvrir le calculateur de ressort pour modifier les paramètres"
+    recalc_button.setToolTip(recalc_tooltip)
     recalc_button.setMinimumWidth(120)
     
     # Bouton OK
@@ -671,6 +728,7 @@ def springUpdateDialog(data, piece, on_recalculate_callback=None):
     button_layout.addWidget(cancel_button)
     
     layout.addLayout(button_layout)
+    layout.setEnabled(True)
     dialog.setLayout(layout)
     
     # Exécution
@@ -679,6 +737,50 @@ def springUpdateDialog(data, piece, on_recalculate_callback=None):
     return dialog.result_action
 
 
+# Module FreeCADGui, importé au premier dialogue de sélection
+_Gui = None
+
+
+def _gui():
+    """Retourne le module FreeCADGui (import différé, mémorisé)."""
+    global _Gui
+    if _Gui is None:
+        import FreeCADGui
+        _Gui = FreeCADGui
+    return _Gui
+
+
+def _view_selection():
+    """Cadre la vue 3D sur la sélection courante."""
+    try:
+        _gui().ActiveDocument.ActiveView.viewSelection()
+    except:
+        pass
+
+
+def _select_object(obj, view_timer):
+    """Sélectionne un objet dans FreeCAD (highlight natif) puis diffère le cadrage."""
+    if obj is None:
+        return
+    Gui = _gui()
+    Gui.Selection.clearSelection()
+    Gui.Selection.addSelection(obj)
+    view_timer.start()  # Redémarre le délai à chaque survol
+
+
+def _on_item_highlighted(combo, view_timer, index):
+    """Appelé quand un item est survolé dans la liste déroulante."""
+    if index >= 0:
+        obj = combo.itemData(index)
+        if obj is not None:
+            _select_object(obj, view_timer)
+
+
+def _on_selection_changed(combo, view_timer, index):
+    """Appelé quand la sélection change (clic)."""
+    _select_object(combo.itemData(index), view_timer)
+
+
 def selectSpringDialog(springs, links=None):
     """
     Dialogue de sélection d'un ressort parmi plusieurs.
@@ -692,8 +794,7 @@ def selectSpringDialog(springs, links=None):
     Returns:
         tuple: (body_sélectionné, is_new) ou (None, None) si annulé
     """
-    import FreeCAD as App
-    import FreeCADGui as Gui
+    Gui = _gui()
     
     if links is None:
         links = {s: [] for s in springs}
@@ -708,30 +809,15 @@ def selectSpringDialog(springs, links=None):
     # Compter les liens
     total_links = sum(len(v) for v in links.values())
     
-    def select_object(obj):
-        """Sélectionne un objet dans FreeCAD (highlight natif)"""
-        if obj is None:
-            return
-        Gui.Selection.clearSelection()
-        Gui.Selection.addSelection(obj)
-        try:
-            Gui.ActiveDocument.ActiveView.viewSelection()
-        except:
-            pass
-    
-    def on_item_highlighted(index):
-        """Appelé quand un item est survolé dans la liste déroulante"""
-        if index >= 0:
-            obj = combo.itemData(index)
-            if obj is not None:
-                select_object(obj)
-    
-    def on_selection_changed(index):
-        """Appelé quand la sélection change (clic)"""
-        obj = combo.itemData(index)
-        select_object(obj)
+    # Le cadrage de la vue n'est fait qu'une fois le survol arrêté
+    view_timer = QtCore.QTimer(dialog)
+    view_timer.setSingleShot(True)
+    view_timer.setTimerType(QtCore.Qt.CoarseTimer)
+    view_timer.setInterval(_VIEW_SELECTION_DELAY_MS)
+    view_timer.timeout.connect(_view_selection)
     
     layout = QtGui.QVBoxLayout()
+    layout.setEnabled(False)
     
     # Label info avec compte ressorts et liens
     if total_links > 0:
@@ -743,7 +829,7 @@ def selectSpringDialog(springs, links=None):
     layout.addWidget(label)
     
     # Info survol
-    hint_label = QtGui.QLabel(f"<i>{tr('select.hint_hover')}</i>")
+    hint_label = QtGui.QLabel(_ITALIC.format(tr('select.hint_hover')))
     hint_label.setAlignment(QtCore.Qt.AlignCenter)
     hint_label.setStyleSheet("color: #888;")
     layout.addWidget(hint_label)
@@ -754,24 +840,38 @@ def selectSpringDialog(springs, links=None):
     combo = QtGui.QComboBox()
     combo.setMinimumHeight(30)
     
+    # Construire le modèle complet puis l'affecter en une fois
+    # (évite un aller-retour Qt et une mise à jour de la liste par élément)
+    model = QStandardItemModel()
+    
+    def append_item(text, obj):
+        item = QStandardItem(text)
+        item.setData(obj, QtCore.Qt.UserRole)  # Rôle lu par combo.itemData()
+        model.appendRow(item)
+    
     # Ajouter les ressorts et leurs liens (indentés)
     for spring in springs:
         # Ajouter le ressort
-        combo.addItem(f"📦 {spring.Label}", spring)
+        append_item(f"📦 {spring.Label}", spring)
         
         # Ajouter les liens indentés
         for link in links.get(spring, []):
-            combo.addItem(f"    🔗 {link.Label}", link)
+            append_item(f"    🔗 {link.Label}", link)
     
     # Option créer nouveau
-    combo.insertSeparator(combo.count())
-    combo.addItem(f"➕ {tr('select.create_new')}", None)
+    append_item(f"➕ {tr('select.create_new')}", None)
+    
+    combo.blockSignals(True)
+    combo.setModel(model)
+    combo.insertSeparator(combo.count() - 1)
+    combo.setCurrentIndex(0)
+    combo.blockSignals(False)
     
     # Connecter le signal highlighted (survol dans la liste déroulante)
-    combo.highlighted.connect(on_item_highlighted)
+    combo.highlighted.connect(partial(_on_item_highlighted, combo, view_timer))
     
     # Connecter le signal de changement de sélection
-    combo.currentIndexChanged.connect(on_selection_changed)
+    combo.currentIndexChanged.connect(partial(_on_selection_changed, combo, view_timer))
     
     layout.addWidget(combo)
     
@@ -779,8 +879,8 @@ def selectSpringDialog(springs, links=None):
     
     # Boutons
     button_layout = QtGui.QHBoxLayout()
-    ok_button = QtGui.QPushButton(tr("common.ok"))
-    cancel_button = QtGui.QPushButton(tr("common.cancel"))
+    ok_button = QtGui.QPushButton(LABELS.ok)
+    cancel_button = QtGui.QPushButton(LABELS.cancel)
     
     ok_button.clicked.connect(dialog.accept)
     cancel_button.clicked.connect(dialog.reject)
@@ -790,16 +890,18 @@ def selectSpringDialog(springs, links=None):
     button_layout.addWidget(cancel_button)
     layout.addLayout(button_layout)
     
+    layout.setEnabled(True)
     dialog.setLayout(layout)
     
     # Highlight initial du premier ressort
     if len(springs) > 0:
         first_obj = combo.itemData(0)
         if first_obj is not None:
-            select_object(first_obj)
+            _select_object(first_obj, view_timer)
     
     # Exécuter le dialogue
     result = dialog.exec()
+    view_timer.stop()
     
     if result == QDialogAccepted:
         selected = combo.itemData(combo.currentIndex())
@@ -833,8 +935,8 @@ def confirmReconstructDialog(spring_name, changes_count):
     """
     msgBox = QtGui.QMessageBox()
     msgBox.setWindowTitle(tr("dlg.confirm_rebuild_title"))
-    msgBox.setText(f"<center>{tr('dlg.confirm_rebuild_msg').format(count=changes_count, name=spring_name)}</center>")
-    msgBox.setInformativeText(f"<center>{tr('dlg.confirm_rebuild_info')}</center>")
+    _set_message_text(msgBox, tr('dlg.confirm_rebuild_msg').format(count=changes_count, name=spring_name))
+    msgBox.setInformativeText(tr('dlg.confirm_rebuild_info'))
     msgBox.setStandardButtons(QMsgBoxYes | QMsgBoxNo)
     msgBox.setDefaultButton(QMsgBoxYes)
     
@@ -852,33 +954,30 @@ def showSuccessMessage(spring_name):
     """
     import FreeCADGui as Gui
     
-    msgBox = QtGui.QMessageBox()
+    try:
+        main_window = Gui.getMainWindow()
+    except:
+        main_window = None
+    
+    # Avec la fenetre FreeCAD pour parent, Qt centre le message dessus
+    msgBox = QtGui.QMessageBox(main_window)
     msgBox.setWindowTitle(tr("dlg.success_title"))
-    msgBox.setText(f"<center>{tr('dlg.success_msg').format(name=spring_name)}</center>")
+    _set_message_text(msgBox, tr('dlg.success_msg').format(name=spring_name))
     msgBox.setIcon(QMsgBoxInformation)
     msgBox.setStandardButtons(QMsgBoxOk)
     
-    # Centrer sur la fenetre FreeCAD
-    try:
-        main_window = Gui.getMainWindow()
-        if main_window:
-            # Ramener FreeCAD au premier plan
-            main_window.raise_()
-            main_window.activateWindow()
-            
-            # Calculer la position centrale apres avoir defini la taille
-            msgBox.adjustSize()
-            main_geo = main_window.geometry()
-            box_size = msgBox.sizeHint()
-            x = main_geo.x() + (main_geo.width() - box_size.width()) // 2
-            y = main_geo.y() + (main_geo.height() - box_size.height()) // 2
-            msgBox.move(x, y)
-    except:
-        pass
+    if main_window:
+        # Ramener FreeCAD au premier plan
+        main_window.raise_()
+        main_window.activateWindow()
     
     msgBox.exec()
 
 
+# Intervalle minimal (ms) de l'animation de progression
+_MIN_PROGRESS_INTERVAL_MS = 100
+
+
 class ProgressDialog(QtGui.QDialog):
     """
     Dialogue de progression pour les operations longues.
@@ -888,9 +987,9 @@ class ProgressDialog(QtGui.QDialog):
     def __init__(self, parent=None, title=None, message=None):
         super().__init__(parent)
         if title is None:
-            title = tr("progress.title")
+            title = LABELS.progress_title
         if message is None:
-            message = tr("progress.message")
+            message = LABELS.progress_message
         self.setWindowTitle(title)
         self.setWindowFlags(QtCore.Qt.Dialog | QtCore.Qt.WindowTitleHint)
         self.setFixedSize(420, 140)
@@ -919,11 +1018,21 @@ class ProgressDialog(QtGui.QDialog):
         self.setLayout(layout)
         
         # Timer pour l'animation
+        # (timer grossier: ne force pas la résolution 1 ms du timer système sous Windows)
         self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.CoarseTimer)
         self.timer.timeout.connect(self._increment_progress)
         self.current_value = 0
         self.target_value = 90  # S'arrete a 90%
         
+        # Rampe animee (animation initiale): un pas par tick de timer,
+        # avancee par la boucle d'evenements de FreeCAD (ni attente ni sleep)
+        self._ramp_timer = QtCore.QTimer(self)
+        self._ramp_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self._ramp_timer.timeout.connect(self._ramp_step)
+        self._ramp_target = 100
+        self._ramp_increment = 5
+        
         # Centrer sur FreeCAD
         self._center_on_freecad()
     
@@ -933,10 +1042,9 @@ class ProgressDialog(QtGui.QDialog):
         try:
             main_window = Gui.getMainWindow()
             if main_window:
-                main_geo = main_window.geometry()
-                x = main_geo.x() + (main_geo.width() - self.width()) // 2
-                y = main_geo.y() + (main_geo.height() - self.height()) // 2
-                self.move(x, y)
+                self.setGeometry(QtGui.QStyle.alignedRect(
+                    QtCore.Qt.LeftToRight, QtCore.Qt.AlignCenter,
+                    self.size(), main_window.geometry()))
         except:
             pass
     
@@ -945,38 +1053,51 @@ class ProgressDialog(QtGui.QDialog):
         if self.current_value < self.target_value:
             self.current_value += 10
             self.progress.setValue(self.current_value)
-            QtGui.QApplication.processEvents()
         else:
             self.timer.stop()
     
     def start_animation(self, interval_ms=800):
-        """Demarre l'animation de la barre de progression."""
+        """Demarre l'animation de la barre de progression (10 rafraichissements/s au plus)."""
         self.current_value = 0
         self.progress.setValue(0)
-        self.timer.start(interval_ms)
+        self.timer.start(max(interval_ms, _MIN_PROGRESS_INTERVAL_MS))
+    
+    def _ramp_step(self):
+        """Avance la rampe d'un pas; s'arrete a la cible (sans jamais reculer)."""
+        current = self.progress.value()
+        if current < self._ramp_target:
+            current = min(current + self._ramp_increment, self._ramp_target)
+            self.progress.setValue(current)
+        if current >= self._ramp_target:
+            self._ramp_timer.stop()
+    
+    def ramp_to(self, target, increment=5, interval_ms=50):
+        """
+        Anime la barre jusqu'a target, pilotee par QTimer.
+        
+        Retourne immediatement: les pas suivants sont faits par la boucle
+        d'evenements de FreeCAD.
+        """
+        if self.progress.value() >= target:
+            return
+        self._ramp_target = target
+        self._ramp_increment = increment
+        self._ramp_timer.start(interval_ms)
     
     def finish(self):
-        """Termine la progression a 100% avec animation."""
-        import time
+        """Termine la progression a 100% (le dialogue est ferme juste apres)."""
         self.timer.stop()
-        current = self.progress.value()
-        # Animer de la valeur actuelle vers 100%
-        for i in range(current, 105, 5):
-            val = min(i, 100)
-            self.progress.setValue(val)
-            self.update()
-            self.repaint()
-            QtGui.QApplication.processEvents()
-            time.sleep(0.05)
+        self._ramp_timer.stop()
+        self.progress.setValue(100)
     
     def set_message(self, message):
-        """Met a jour le message affiche."""
+        """Met a jour le message affiche (repeint au prochain tour de boucle d'evenements)."""
         self.label.setText(message)
-        QtGui.QApplication.processEvents()
     
     def closeEvent(self, event):
-        """Arrete le timer a la fermeture."""
+        """Arrete les timers a la fermeture."""
         self.timer.stop()
+        self._ramp_timer.stop()
         super().closeEvent(event)
 
 
@@ -992,12 +1113,11 @@ def showProgressDialog(title=None, message=None):
         ProgressDialog: Le dialogue (a fermer avec .close())
     """
     import FreeCADGui as Gui
-    import time
     
     if title is None:
-        title = tr("progress.title")
+        title = LABELS.progress_title
     if message is None:
-        message = tr("progress.message")
+        message = LABELS.progress_message
     
     dialog = ProgressDialog(Gui.getMainWindow(), title, message)
     
@@ -1008,11 +1128,6 @@ def showProgressDialog(title=None, message=None):
     
     # Animation initiale avant le travail lourd (0% -> 30%)
     # Car pendant la reconstruction, le thread est bloque
-    for i in range(0, 35, 5):
-        dialog.progress.setValue(i)
-        dialog.update()
-        dialog.repaint()
-        QtGui.QApplication.processEvents()
-        time.sleep(0.1)
+    dialog.ramp_to(30, 5, 100)
     
     return dialog
@@ -14,11 +14,43 @@ import Part
 import Sketcher
 
 
+# Position du YZ_Plane dans Origin.OriginFeatures
+# (ordre FreeCAD: X_Axis, Y_Axis, Z_Axis, XY_Plane, XZ_Plane, YZ_Plane)
+_yz_plane_index = 5
+
+
+def _get_yz_plane(part):
+    """Retourne le YZ_Plane de l'Origin du Body (position mémorisée)."""
+    global _yz_plane_index
+    features = part.Origin.OriginFeatures
+    if _yz_plane_index < len(features) and 'YZ' in features[_yz_plane_index].Name:
+        return features[_yz_plane_index]
+    # Ordre inattendu: recherche par nom puis mémorisation de la position
+    for index, feature in enumerate(features):
+        if 'YZ' in feature.Name or feature.Name == 'YZ_Plane':
+            _yz_plane_index = index
+            return feature
+    return features[1]
+
+
 class Helix():
     """
     Classe définissant la géométrie des hélices du ressort.
     """
     
+    # CORRECTION v1.3: Positionnement Z du centre du cercle selon type d'extrémité
+    # (d: diamètre du fil, nm: spires mortes par extrémité)
+    _END_TYPE_Z = {
+        # COUPEES: section tangente en bas, centre à d/2
+        "COUPEES": lambda d, nm: d / 2,
+        # MEULEES: axe dans le plan Z=0
+        "MEULEES": lambda d, nm: 0,
+        # RAPPROCHEES_MEULEES: après spires mortes, axe coupé par Pocket
+        "RAPPROCHEES_MEULEES": lambda d, nm: nm * d,
+        # RAPPROCHEES: après spires mortes, section tangente
+        "RAPPROCHEES": lambda d, nm: nm * d + d / 2,
+    }
+    
     def __init__(self, data, name, sketch, pitch, height, turns, reverse, gap=0, base_face=None):
         """
         Crée une hélice.
@@ -58,7 +90,7 @@ class Helix():
             self.helix = self.part.newObject('PartDesign::AdditiveHelix', name)
             
             # Définir la face directement comme profil
-            self.helix.Profile = (base_object, ['Face' + str(face_index)])
+            self.helix.Profile = (base_object, [f'Face{face_index}'])
             # Utiliser l'axe Z comme référence pour les hélices basées sur face
             self.helix.ReferenceAxis = (self.part.Origin.OriginFeatures[2], [''])  # Z_Axis est à l'index 2
             self.drawing = None  # Pas de sketch nécessaire
@@ -76,47 +108,28 @@ class Helix():
         drawing = self.part.newObject('Sketcher::SketchObject', sketch_name)
         
         # Obtenir le YZ_Plane depuis l'Origin du Body
-        yz_plane = None
-        for feature in self.part.Origin.OriginFeatures:
-            if 'YZ' in feature.Name or feature.Name == 'YZ_Plane':
-                yz_plane = feature
-                break
-        if yz_plane is None:
-            yz_plane = self.part.Origin.OriginFeatures[1]
+        yz_plane = _get_yz_plane(self.part)
         
         # Attacher le sketch au plan YZ
         drawing.MapMode = 'FlatFace'
         drawing.AttachmentSupport = [(yz_plane, '')]
+        # Pas de recompute ici: la géométrie est définie dans le repère du sketch,
+        # l'attachement est appliqué par le recompute de Spring.helixes()
         
-        # Recalculer pour appliquer l'attachement
-        App.ActiveDocument.recompute()
-        
-        # CORRECTION v1.3: Positionnement Z du centre du cercle selon type d'extrémité
-        # - COUPEES: Z = d/2 (section tangente au LCS)
-        # - MEULEES: Z = 0 (axe dans plan LCS, coupé par Pocket)
-        # - RAPPROCHEES: Z = nm * d + d/2 (après spires mortes, section tangente)
-        # - RAPPROCHEES_MEULEES: Z = nm * d (après spires mortes, axe coupé par Pocket)
-        
+        # Positionnement Z du centre du cercle selon type d'extrémité (cf. _END_TYPE_Z)
         d = data.adjustedWireDiameter
-        nm = data.deadTurnsQty if hasattr(data, 'deadTurnsQty') else 0
+        nm = getattr(data, 'deadTurnsQty', 0)
+        if nm < 0.0001:
+            nm = 0  # Sans spires mortes: rapprochées = coupées, rapprochées meulées = meulées
         
         # Déterminer le type d'extrémité
-        end_type = ""
-        if hasattr(data, 'extremeTurns'):
-            end_type = data.extremeTurns.upper().replace(" ", "_")
+        end_type = getattr(data, 'extremeTurns', "").upper().replace(" ", "_")
         
-        if end_type == "COUPEES" or (nm < 0.0001 and "MEULEES" not in end_type):
-            # COUPEES: section tangente en bas, centre à d/2
-            circle_center_y = d / 2
-        elif end_type == "MEULEES" or (nm < 0.0001 and "MEULEES" in end_type):
-            # MEULEES: axe dans le plan Z=0
-            circle_center_y = 0
-        elif "MEULEES" in end_type:
-            # RAPPROCHEES_MEULEES: Z = nm * d
-            circle_center_y = nm * d
-        else:
-            # RAPPROCHEES: Z = nm * d + d/2
-            circle_center_y = nm * d + d / 2
+        z_rule = self._END_TYPE_Z.get(end_type)
+        if z_rule is None:
+            # Type inconnu: meulé ou non selon le nom
+            z_rule = self._END_TYPE_Z["RAPPROCHEES_MEULEES" if "MEULEES" in end_type else "RAPPROCHEES"]
+        circle_center_y = z_rule(d, nm)
         
         drawing.addGeometry(Part.Circle(
             App.Vector((data.meanDiameter / 2), circle_center_y, 0),
@@ -11,92 +11,186 @@ Translations: French (fr.json), and other languages
 Version: 1.2.0 - Translation mode controlled by file timestamps
 """
 
+import logging
 import os
-import json
+import sys
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+
+# Parseur JSON: orjson (C) si disponible, sinon json de la bibliothèque standard
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Messages de diagnostic: le niveau affiché est réglé par l'application
+# hôte (ex: logging.getLogger("SpringFull").setLevel(logging.DEBUG));
+# sans configuration, seuls les avertissements sont émis (niveau racine)
+_log = logging.getLogger("SpringFull.I18n")
 
 # Global variables for current language
 _current_language = "en"
-_translations = {}
+_translations = MappingProxyType({})  # Read-only, replaced on each load
 _fallback_language = "en"  # English is the reference/fallback language
+_loaded = False  # True once load_translations() has run
+_loaded_language = None  # Language of the loaded _translations
+_fallback_translations = None  # Fallback catalog, read on the first missing key
+_catalog_cache = {}  # Parsed locale files: {path: (mtime, data)}
+_dialog_mode = None  # Result of should_show_language_dialog() for this session
+_material_names = {}  # "piano_wire" -> translated name (active language)
+_treatment_names = {}  # "shot_peening" -> translated name (active language)
+_qt = None  # Qt classes of the language dialog, imported on first use
+
+# Libellés statiques des dialogues, résolus à chaque chargement de langue
+# (attribut -> clé de traduction); l'objet LABELS est mis à jour sur place
+_LABEL_KEYS = {
+    "ok": "common.ok",
+    "cancel": "common.cancel",
+    "progress_title": "progress.title",
+    "progress_message": "progress.message",
+}
+
+
+class _Labels(SimpleNamespace):
+    """Libellés statiques; le premier accès charge les traductions."""
+    
+    def __getattr__(self, name):
+        if name in _LABEL_KEYS and not _loaded:
+            load_translations()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+
+LABELS = _Labels()
+
+
+# Chemins calculés une fois à l'import
+_MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
+_LOCALES_PATH = os.path.join(_MODULE_PATH, "locales")
 
 
 def get_module_path():
     """Retourne le chemin vers le dossier du module SpringFull."""
-    return os.path.dirname(os.path.abspath(__file__))
+    return _MODULE_PATH
 
 
 def get_locales_path():
     """Retourne le chemin vers le dossier locales."""
-    return os.path.join(get_module_path(), "locales")
+    return _LOCALES_PATH
 
 
 def should_show_language_dialog():
     """
     Détermine si le dialogue de sélection de langue doit être affiché.
     
-    Logique basée sur les timestamps de deux fichiers de contrôle:
+    Si translate_mode.txt existe, son contenu décide: "on" → afficher le
+    dialogue, "off" → langue système automatiquement.
+    
+    Sinon, logique basée sur les timestamps de deux fichiers de contrôle:
     - Translate_on.txt  : Si plus récent → afficher le dialogue
     - Translate_off.txt : Si plus récent → utiliser la langue système automatiquement
     
+    Le résultat est déterminé une fois par session.
+    
     Returns:
         bool: True si le dialogue doit être affiché, False sinon
     """
-    module_dir = get_module_path()
+    global _dialog_mode
+    
+    if _dialog_mode is None:
+        _dialog_mode = _read_dialog_mode()
+    return _dialog_mode
+
+
+def _stat_mtime(path):
+    """Date de modification d'un fichier, ou None s'il n'existe pas."""
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _read_dialog_mode():
+    """Lit le mode (dialogue/automatique) depuis les fichiers de contrôle."""
+    module_dir = _MODULE_PATH
+    
+    # Fichier de mode unique: une seule lecture
+    try:
+        with open(os.path.join(module_dir, "translate_mode.txt"), 'rb') as f:
+            mode = f.read(3).strip().lower()
+    except FileNotFoundError:
+        mode = None
+    except OSError as e:
+        _log.warning("[SpringFull I18n] Erreur lecture translate_mode.txt: %s", e)
+        mode = None
+    if mode == b"on":
+        _log.debug("[SpringFull I18n] Mode: dialogue (translate_mode.txt)")
+        return True
+    if mode == b"off":
+        _log.debug("[SpringFull I18n] Mode: automatique (translate_mode.txt)")
+        return False
+    
+    # Compatibilité: comparaison des timestamps Translate_on/off.txt
     translate_on_file = os.path.join(module_dir, "Translate_on.txt")
     translate_off_file = os.path.join(module_dir, "Translate_off.txt")
     
-    # Vérifier l'existence des fichiers
-    on_exists = os.path.exists(translate_on_file)
-    off_exists = os.path.exists(translate_off_file)
+    # Un seul stat() par fichier: existence et timestamp
+    try:
+        on_mtime = _stat_mtime(translate_on_file)
+        off_mtime = _stat_mtime(translate_off_file)
+    except OSError as e:
+        _log.warning("[SpringFull I18n] Erreur lecture timestamps: %s", e)
+        # En cas d'erreur, afficher le dialogue par sécurité
+        return True
     
     # Cas où un seul fichier existe
-    if on_exists and not off_exists:
-        print("[SpringFull I18n] Mode: dialogue (Translate_on.txt seul présent)")
+    if on_mtime is not None and off_mtime is None:
+        _log.debug("[SpringFull I18n] Mode: dialogue (Translate_on.txt seul présent)")
         return True
     
-    if off_exists and not on_exists:
-        print("[SpringFull I18n] Mode: automatique (Translate_off.txt seul présent)")
+    if off_mtime is not None and on_mtime is None:
+        _log.debug("[SpringFull I18n] Mode: automatique (Translate_off.txt seul présent)")
         return False
     
     # Cas où aucun fichier n'existe - par défaut, afficher le dialogue
-    if not on_exists and not off_exists:
-        print("[SpringFull I18n] Mode: dialogue (fichiers de contrôle absents)")
+    if on_mtime is None and off_mtime is None:
+        _log.debug("[SpringFull I18n] Mode: dialogue (fichiers de contrôle absents)")
         return True
     
     # Les deux fichiers existent - comparer les timestamps
-    try:
-        on_mtime = os.path.getmtime(translate_on_file)
-        off_mtime = os.path.getmtime(translate_off_file)
-        
-        if on_mtime > off_mtime:
-            print("[SpringFull I18n] Mode: dialogue (Translate_on.txt plus récent)")
-            return True
-        else:
-            print("[SpringFull I18n] Mode: automatique (Translate_off.txt plus récent)")
-            return False
-    except OSError as e:
-        print(f"[SpringFull I18n] Erreur lecture timestamps: {e}")
-        # En cas d'erreur, afficher le dialogue par sécurité
+    if on_mtime > off_mtime:
+        _log.debug("[SpringFull I18n] Mode: dialogue (Translate_on.txt plus récent)")
         return True
+    else:
+        _log.debug("[SpringFull I18n] Mode: automatique (Translate_off.txt plus récent)")
+        return False
+
+
+# Supported languages (FreeCAD language name or code -> language code)
+_SUPPORTED_LANGUAGES = {
+    "french": "fr", "français": "fr", "fr": "fr",
+    "english": "en", "en": "en",
+    "german": "de", "deutsch": "de", "de": "de",
+    "spanish": "es", "español": "es", "es": "es",
+    "italian": "it", "italiano": "it", "it": "it"
+}
+_SUPPORTED_CODES = frozenset(_SUPPORTED_LANGUAGES.values())
 
 
+@lru_cache(maxsize=None)
 def detect_language():
     """
     Detects the language to use.
     Priority: FreeCAD > System > Default (en)
     
+    The result is computed once per session (detect_language.cache_clear()
+    forces a new detection).
+    
     Returns:
         str: Language code ("en", "fr", "de", "es", "it")
     """
-    # Supported languages
-    supported_languages = {
-        "french": "fr", "français": "fr", "fr": "fr",
-        "english": "en", "en": "en",
-        "german": "de", "deutsch": "de", "de": "de",
-        "spanish": "es", "español": "es", "es": "es",
-        "italian": "it", "italiano": "it", "it": "it"
-    }
-    
     # Try to detect from FreeCAD
     try:
         import FreeCAD
@@ -106,21 +200,36 @@ def detect_language():
         
         if fc_language:
             fc_lang_lower = fc_language.lower()
-            # Check for exact match first
-            for key, lang_code in supported_languages.items():
+            # Check for exact match first, then ISO prefix ("fr_FR" -> "fr")
+            lang_code = (_SUPPORTED_LANGUAGES.get(fc_lang_lower)
+                         or _SUPPORTED_LANGUAGES.get(fc_lang_lower[:2]))
+            if lang_code:
+                return lang_code
+            # Then partial match ("French (France)", "fr_FR", ...)
+            for key, lang_code in _SUPPORTED_LANGUAGES.items():
                 if key in fc_lang_lower or fc_lang_lower.startswith(lang_code):
                     return lang_code
     except:
         pass
     
     # Try to detect from system
+    # (environment first - POSIX priority order - then the process locale;
+    # locale.getdefaultlocale() is deprecated since Python 3.11)
     try:
-        import locale
-        system_locale = locale.getdefaultlocale()[0]
+        system_locale = (os.environ.get('LC_ALL') or os.environ.get('LC_MESSAGES')
+                         or os.environ.get('LANG'))
+        if not system_locale:
+            import locale
+            system_locale = locale.getlocale()[0]
         if system_locale:
             lang_prefix = system_locale[:2].lower()
-            if lang_prefix in ["fr", "en", "de", "es", "it"]:
+            if lang_prefix in _SUPPORTED_CODES:
                 return lang_prefix
+            # Windows locale names: "German_Germany", "Spanish_Spain", ...
+            system_lower = system_locale.lower()
+            for key, lang_code in _SUPPORTED_LANGUAGES.items():
+                if len(key) > 2 and key in system_lower:
+                    return lang_code
     except:
         pass
     
@@ -128,49 +237,121 @@ def detect_language():
     return "en"
 
 
-def load_translations(language=None):
+def _read_catalog(path):
+    """
+    Reads a JSON locale file, reparsing it only if it changed on disk.
+    
+    The returned dict is shared with the cache and must not be modified.
+    """
+    mtime = os.stat(path).st_mtime
+    cached = _catalog_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    _catalog_cache[path] = (mtime, data)
+    return data
+
+
+def load_translations(language=None, force=False):
     """
     Loads translations for a given language.
     
     Args:
         language: Language code ("en" or "fr"). If None, auto-detect.
+        force: Reload even if this language is already loaded.
     """
-    global _current_language, _translations
+    global _current_language, _translations, _fallback_translations, _loaded, _loaded_language
+    global _material_names, _treatment_names
     
     if language is None:
         language = detect_language()
     
+    # Already loaded: nothing to do
+    if _loaded and language == _loaded_language and not force:
+        _current_language = language
+        return
+    
     _current_language = language
     
-    locales_path = get_locales_path()
+    locales_path = _LOCALES_PATH
     lang_file = os.path.join(locales_path, f"{language}.json")
     
     # Load the translation file
     if os.path.exists(lang_file):
         try:
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                _translations = json.load(f)
-            print(f"[SpringFull I18n] Language loaded: {language}")
+            _translations = _read_catalog(lang_file)
+            _log.info("[SpringFull I18n] Language loaded: %s", language)
         except Exception as e:
-            print(f"[SpringFull I18n] Error loading {lang_file}: {e}")
+            _log.warning("[SpringFull I18n] Error loading %s: %s", lang_file, e)
             _translations = {}
     else:
-        print(f"[SpringFull I18n] File not found: {lang_file}")
+        _log.warning("[SpringFull I18n] File not found: %s", lang_file)
         _translations = {}
     
-    # Load fallback (English) if different from current language
-    if language != _fallback_language:
-        fallback_file = os.path.join(locales_path, f"{_fallback_language}.json")
-        if os.path.exists(fallback_file):
-            try:
-                with open(fallback_file, 'r', encoding='utf-8') as f:
-                    fallback_trans = json.load(f)
-                # Merge (current language has priority)
-                for key, value in fallback_trans.items():
-                    if key not in _translations:
-                        _translations[key] = value
-            except:
-                pass
+    # Le fallback (anglais) n'est lu qu'à la première clé manquante
+    _fallback_translations = None
+    
+    # Clés internées: hachage et comparaison par identité dans tr()
+    # (vue en lecture seule, remplacée entièrement au prochain chargement)
+    _translations = MappingProxyType(
+        {sys.intern(key): value for key, value in _translations.items()})
+    
+    # Noms de matériaux/traitements indexés directement par leur clé courte
+    _material_names = _names_with_prefix("material.")
+    _treatment_names = _names_with_prefix("treatment.")
+    
+    _loaded = True
+    _loaded_language = language
+    _tr_static.cache_clear()
+    _update_labels()
+
+
+def _names_with_prefix(prefix):
+    """Traductions des clés commençant par prefix, indexées sans le préfixe."""
+    start = len(prefix)
+    return {key[start:]: value for key, value in _translations.items()
+            if key.startswith(prefix)}
+
+
+def _load_fallback():
+    """
+    Charge le catalogue de repli (anglais) pour les clés absentes
+    de la langue courante.
+    
+    Returns:
+        MappingProxyType: Traductions de repli (vide si langue courante = repli)
+    """
+    global _fallback_translations
+    
+    if _fallback_translations is None:
+        _fallback_translations = MappingProxyType({})
+        if _loaded_language != _fallback_language:
+            fallback_file = os.path.join(_LOCALES_PATH, f"{_fallback_language}.json")
+            if os.path.exists(fallback_file):
+                try:
+                    _fallback_translations = MappingProxyType(
+                        {sys.intern(key): value for key, value
+                         in _read_catalog(fallback_file).items()})
+                except:
+                    pass
+    return _fallback_translations
+
+
+def _update_labels():
+    """Résout les libellés statiques de LABELS dans la langue chargée."""
+    for name, key in _LABEL_KEYS.items():
+        setattr(LABELS, name, _tr_static(key))
+
+
+@lru_cache(maxsize=512)
+def _tr_static(key):
+    """Traduction brute d'une clé (mémorisée jusqu'au prochain chargement)."""
+    text = _translations.get(key)
+    if text is None:
+        # Clé absente: repli sur l'anglais (chargé à la demande)
+        text = _load_fallback().get(key, key)
+    return text
 
 
 def tr(key, *args, **kwargs):
@@ -185,27 +366,27 @@ def tr(key, *args, **kwargs):
     Returns:
         str: Texte traduit ou clé si non trouvée
     """
-    global _translations
-    
     # Charger les traductions si pas encore fait
-    if not _translations:
+    if not _loaded:
         load_translations()
     
-    # Récupérer la traduction
-    text = _translations.get(key, key)
+    text = _tr_static(key)
     
-    # Appliquer le formatage si des arguments sont fournis
-    if args or kwargs:
-        try:
-            text = text.format(*args, **kwargs)
-        except:
-            pass
+    # Sans arguments ou sans champ à remplacer: traduction brute
+    if not (args or kwargs) or "{" not in text:
+        return text
     
-    return text
+    # Avec arguments: formatage direct (50 et 50.0 ne donnent pas le même texte)
+    try:
+        return text.format(*args, **kwargs)
+    except:
+        return text
 
 
 def get_current_language():
     """Retourne la langue courante."""
+    if not _loaded:
+        load_translations()
     return _current_language
 
 
@@ -219,27 +400,44 @@ def set_language(language):
     load_translations(language)
 
 
+@lru_cache(maxsize=None)
+def _available_languages():
+    """Liste triée des langues disponibles (lecture du dossier une seule fois)."""
+    try:
+        with os.scandir(_LOCALES_PATH) as entries:
+            # Enlever .json
+            return tuple(sorted(entry.name[:-5] for entry in entries
+                                if entry.name.endswith('.json') and entry.is_file()))
+    except FileNotFoundError:
+        return ()
+
+
 def get_available_languages():
     """
     Retourne la liste des langues disponibles.
     
+    Le contenu du dossier locales est mémorisé; appeler
+    invalidate_language_cache() pour le relire.
+    
     Returns:
         list: Liste des codes langue disponibles
     """
-    locales_path = get_locales_path()
-    languages = []
-    
-    if os.path.exists(locales_path):
-        for filename in os.listdir(locales_path):
-            if filename.endswith('.json'):
-                lang_code = filename[:-5]  # Enlever .json
-                languages.append(lang_code)
-    
-    return sorted(languages)
+    return list(_available_languages())
+
+
+def invalidate_language_cache():
+    """Oublie la liste mémorisée des langues (relue au prochain appel)."""
+    _available_languages.cache_clear()
 
 
 # === FONCTIONS UTILITAIRES POUR LES MATÉRIAUX ===
 
+# Clés complètes internées pour les noms absents de la langue courante
+# (repli via tr()): {"piano_wire": "material.piano_wire", ...}
+_material_keys = {}
+_treatment_keys = {}
+
+
 def tr_material(material_key):
     """
     Traduit un nom de matériau.
@@ -250,7 +448,15 @@ def tr_material(material_key):
     Returns:
         str: Nom traduit du matériau
     """
-    return tr(f"material.{material_key}")
+    if not _loaded:
+        load_translations()
+    text = _material_names.get(material_key)
+    if text is not None:
+        return text
+    key = _material_keys.get(material_key)
+    if key is None:
+        key = _material_keys[material_key] = sys.intern(f"material.{material_key}")
+    return tr(key)
 
 
 def tr_treatment(treatment_key):
@@ -263,7 +469,15 @@ def tr_treatment(treatment_key):
     Returns:
         str: Nom traduit du traitement
     """
-    return tr(f"treatment.{treatment_key}")
+    if not _loaded:
+        load_translations()
+    text = _treatment_names.get(treatment_key)
+    if text is not None:
+        return text
+    key = _treatment_keys.get(treatment_key)
+    if key is None:
+        key = _treatment_keys[treatment_key] = sys.intern(f"treatment.{treatment_key}")
+    return tr(key)
 
 
 def show_language_dialog():
@@ -286,19 +500,51 @@ def show_language_dialog():
         # Mode automatique - détecter la langue système
         detected_lang = detect_language()
         set_language(detected_lang)
-        print(f"[SpringFull I18n] Langue détectée automatiquement: {detected_lang}")
+        _log.info("[SpringFull I18n] Langue détectée automatiquement: %s", detected_lang)
         return True
     
     # Mode dialogue - afficher la sélection de langue
-    # Import Qt
-    try:
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton
-        from PySide6.QtCore import Qt
-        QDialogAccepted = QDialog.DialogCode.Accepted
-    except ImportError:
-        from PySide.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton
-        from PySide.QtCore import Qt
-        QDialogAccepted = QDialog.Accepted
+    return _run_language_dialog()
+
+
+def _ensure_qt():
+    """
+    Importe les classes Qt du dialogue de langue (une seule fois).
+    
+    Returns:
+        SimpleNamespace: QDialog, QVBoxLayout, ..., Qt, QDialogAccepted
+    """
+    global _qt
+    
+    if _qt is None:
+        try:
+            from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton
+            from PySide6.QtCore import Qt
+            QDialogAccepted = QDialog.DialogCode.Accepted
+        except ImportError:
+            from PySide.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton
+            from PySide.QtCore import Qt
+            QDialogAccepted = QDialog.Accepted
+        _qt = SimpleNamespace(
+            QDialog=QDialog, QVBoxLayout=QVBoxLayout, QHBoxLayout=QHBoxLayout,
+            QLabel=QLabel, QComboBox=QComboBox, QPushButton=QPushButton,
+            Qt=Qt, QDialogAccepted=QDialogAccepted)
+    return _qt
+
+
+def _run_language_dialog():
+    """
+    Affiche le dialogue de sélection de langue (mode Translate_on uniquement).
+    
+    Les imports Qt et la construction des widgets ne sont faits que dans ce
+    mode; le démarrage en mode automatique ne passe jamais par ici.
+    
+    Returns:
+        bool: True si langue sélectionnée, False si annulé
+    """
+    qt = _ensure_qt()
+    QDialog, QVBoxLayout, QHBoxLayout = qt.QDialog, qt.QVBoxLayout, qt.QHBoxLayout
+    QLabel, QComboBox, QPushButton, Qt = qt.QLabel, qt.QComboBox, qt.QPushButton, qt.Qt
     
     try:
         import FreeCADGui as Gui
@@ -372,15 +618,11 @@ def show_language_dialog():
     layout.addLayout(btn_layout)
     
     # Exécution
-    if dialog.exec() == QDialogAccepted:
+    if dialog.exec() == qt.QDialogAccepted:
         selected_lang = combo.currentData()
         if selected_lang != current_lang:
             set_language(selected_lang)
-            print(f"[SpringFull I18n] Langue changée: {selected_lang}")
+            _log.info("[SpringFull I18n] Langue changée: %s", selected_lang)
         return True
     
     return False
-
-
-# Initialisation au chargement du module
-load_translations()
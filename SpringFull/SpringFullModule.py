@@ -19,9 +19,13 @@ import FreeCAD as App
 import FreeCADGui as Gui
 import Sketcher
 import Part
-import time
 import json
 import os
+import re
+import time
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
 
 # Import compatible PySide2/PySide6
 try:
@@ -34,6 +38,210 @@ from SpringFull.SpringFullHelixModule import Helix
 from SpringFull.SpringFullI18nModule import tr
 
 
+@dataclass(frozen=True)
+class MaterialSpec:
+    """Propriétés d'affichage d'un matériau (couleurs en tuples (r, g, b))."""
+    __slots__ = ('name', 'diffuse', 'ambient', 'specular', 'emissive',
+                 'shininess', 'transparency')
+    name: str
+    diffuse: tuple
+    ambient: tuple
+    specular: tuple
+    emissive: tuple
+    shininess: float
+    transparency: float
+
+
+# Propriétés par défaut quand le matériau ne peut pas être lu
+_UNKNOWN_MATERIAL = MaterialSpec("UNKNOWN MATERIAL", (0.2, 0.2, 0.2), (0.29, 0.29, 0.29),
+                                 (0.98, 0.98, 0.98), (0.0, 0.0, 0.0), 0.02, 0.0)
+
+
+# Messages de suivi de la construction: affichés seulement si SPRINGFULL_VERBOSE=1
+# (avertissements et erreurs toujours affichés)
+_VERBOSE = os.environ.get('SPRINGFULL_VERBOSE', '0') == '1'
+
+
+def _log(key, **kwargs):
+    """Affiche un message de suivi traduit (traduit seulement si affiché)."""
+    if _VERBOSE:
+        App.Console.PrintMessage(f"[SpringFull] {tr(key, **kwargs)}\n")
+
+
+def _log_detail(key, **kwargs):
+    """Affiche une ligne de détail (sans préfixe) d'un message de suivi."""
+    if _VERBOSE:
+        App.Console.PrintMessage(f"{tr(key, **kwargs)}\n")
+
+
+# Origine et axe Z partagés (recopiés par Part.Circle, App.Rotation et
+# App.Placement): ne jamais les modifier sur place
+_V_ORIGIN = App.Vector(0, 0, 0)
+_V_ZUP = App.Vector(0, 0, 1)
+
+# Intervalle minimal entre deux traitements d'événements Qt pendant la construction (s)
+_PROGRESS_EVENTS_INTERVAL = 0.05
+
+
+# Type d'extrémité -> extrémités meulées (chaîne testée une fois par valeur)
+@lru_cache(maxsize=None)
+def _ground_ends(extreme_turns):
+    """Type d'extrémité meulé ? (None si le type n'est pas défini)"""
+    if extreme_turns is None:
+        return None
+    end_type_upper = extreme_turns.upper()
+    return 'MEULEES' in end_type_upper or 'MEULÉE' in end_type_upper
+
+
+# Propriété de sens d'extrusion par type de feature (fixe pour une version de FreeCAD):
+# {TypeId: 'SideType' (FreeCAD 1.1+) | 'Midplane' (FreeCAD 1.0) | None}
+_SIDE_PROPERTY = {}
+
+
+def _set_one_side(feature):
+    """Extrusion d'un seul côté (Pad/Pocket), compatible FreeCAD 1.0 et 1.1+."""
+    type_id = feature.TypeId
+    if type_id not in _SIDE_PROPERTY:
+        # Première feature de ce type: détection mémorisée pour la session
+        if hasattr(feature, 'SideType'):
+            _SIDE_PROPERTY[type_id] = 'SideType'
+        elif hasattr(feature, 'Midplane'):
+            _SIDE_PROPERTY[type_id] = 'Midplane'
+        else:
+            _SIDE_PROPERTY[type_id] = None
+    prop = _SIDE_PROPERTY[type_id]
+    if prop == 'SideType':
+        feature.SideType = 'One side'  # FreeCAD 1.1+
+    elif prop == 'Midplane':
+        feature.Midplane = False  # FreeCAD 1.0
+
+
+# Noms des arêtes circulaires du tube simplifié (à arrondir), par géométrie:
+# {(rayon ext, rayon int, hauteur): ["Edge1", ...]}, borné aux dernières géométries
+_TUBE_FILLET_EDGES = {}
+_TUBE_FILLET_EDGES_MAX = 32
+
+
+def _gui_document(doc):
+    """Document GUI associé à doc, None sans interface graphique."""
+    try:
+        return Gui.getDocument(doc.Name)
+    except Exception:
+        return None
+
+
+# Arbre de modèle de FreeCAD (référence faible, trouvé une seule fois)
+_tree_ref = None
+
+
+def _get_tree_widget():
+    """Retourne le QTreeWidget de l'arbre de modèle (recherché au premier appel)."""
+    global _tree_ref
+    
+    tree = _tree_ref() if _tree_ref is not None else None
+    if tree is not None:
+        try:
+            tree.objectName()  # Widget C++ encore valide?
+            return tree
+        except RuntimeError:
+            pass
+    
+    _tree_ref = None
+    mw = Gui.getMainWindow()
+    if mw:
+        # Chercher tous les QTreeWidget (le nom "treeWidget" ne fonctionne pas)
+        trees = mw.findChildren(QtGui.QTreeWidget)
+        if trees:
+            _tree_ref = weakref.ref(trees[0])
+            return trees[0]
+    return None
+
+
+# Noms des LCS: (suffixe numérique éventuel, nom de base seul), compilés une fois
+# Gère: Local_Top, Local_Top001, Local_Top_001, Local_Top_v2, etc.
+_LCS_NAME_PATTERNS = {
+    base: (re.compile(base + r'[_]?(\d+)?$'), re.compile(base + r'$'))
+    for base in ('Local_Top', 'Local_Bottom')
+}
+
+
+def _lcs_suffix_number(name, suffix_re, base_re):
+    """
+    Extrait le suffixe numérique d'un nom LCS.
+    Ex: 'Local_Top' → 0, 'Local_Top001' → 1, 'Local_Top_002' → 2
+    """
+    match = suffix_re.search(name)
+    if match and match.group(1):
+        return int(match.group(1))
+    # Pas de suffixe numérique = c'est le premier (suffixe 0)
+    if base_re.match(name):
+        return 0
+    return float('inf')  # Nom non reconnu, mettre à la fin
+
+
+@lru_cache(maxsize=64)
+def _read_material_cached(material_file_path, mtime, material_name):
+    """
+    Lit les propriétés matériau (mémorisé par fichier, date de
+    modification et matériau: une modification du fichier invalide le cache).
+    """
+    try:
+        with open(material_file_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        
+        materials = config.get('materials', {})
+        metadata = config.get('metadata', {})
+        color_data = None
+        found_name = material_name
+        material_upper = material_name.strip().upper()
+        
+        for mat_name, mat_props in materials.items():
+            if mat_name.strip().upper() == material_upper:
+                color_data = mat_props.get('color')
+                found_name = mat_name
+                break
+        
+        if color_data is None:
+            App.Console.PrintWarning(f"[SpringFull] {tr('console.warn_color_not_found', name=material_name)}\n")
+            color_data = metadata.get('default_color')
+            found_name = 'DEFAULT'
+            if color_data is None:
+                return _UNKNOWN_MATERIAL
+        
+        def rgb(lst):
+            return (float(lst[0]), float(lst[1]), float(lst[2]))
+        
+        diffuse = rgb(color_data.get('diffuse', [0.2, 0.2, 0.2]))
+        ambient = rgb(color_data.get('ambient', [0.29, 0.29, 0.29]))
+        specular = rgb(color_data.get('specular', [0.98, 0.98, 0.98]))
+        emissive = rgb(color_data.get('emissive', [0, 0, 0]))
+        shiny = float(color_data.get('shininess', 0.02))
+        transpar = float(color_data.get('transparency', 0.0))
+        
+        return MaterialSpec(found_name, diffuse, ambient, specular, emissive, shiny, transpar)
+        
+    except Exception as e:
+        App.Console.PrintError(f"[SpringFull] {tr('console.error_material_read', error=e)}\n")
+        return _UNKNOWN_MATERIAL
+
+
+@lru_cache(maxsize=16)
+def _app_material(spec, transparency):
+    """
+    App.Material construit une fois par matériau et transparence (réutilisé
+    pour le Tip et le Body, et d'une reconstruction à l'autre; l'affectation
+    à une propriété du ViewObject en fait une copie).
+    """
+    return App.Material(
+        DiffuseColor=spec.diffuse,
+        AmbientColor=spec.ambient,
+        SpecularColor=spec.specular,
+        EmissiveColor=spec.emissive,
+        Shininess=spec.shininess,
+        Transparency=transparency
+    )
+
+
 class Spring:
     """
     Classe définissant la géométrie complète du ressort.
@@ -47,7 +255,20 @@ class Spring:
         self.piece = piece
         self.data = data
         self.progress_dialog = progress_dialog
+        # Plan XY de l'Origin (support des LCS et du sketch du tube)
+        self._xy_plane = self.piece.Origin.OriginFeatures[3]
         self.progress_value = 30  # Commence à 30% (après animation initiale)
+        self._last_progress_ts = 0.0  # Dernier processEvents() (time.monotonic)
+        
+        # Sans interface (mode batch): pas de masquage/réaffichage des features
+        # (document GUI du Body lui-même: il n'est pas forcément le document actif)
+        self._gui_doc = _gui_document(self.piece.Document)
+        self._has_gui = self._gui_doc is not None
+        
+        # Valeurs de data lues une fois pour toute la construction
+        self._simplified = bool(getattr(data, 'simplified', False))
+        self._display_height = getattr(data, 'displayHeight', data.onLoadHight)
+        self._ground_ends = _ground_ends(getattr(data, 'extremeTurns', None))
         
         # Dictionnaire pour stocker les références aux objets créés
         self.objects = {}
@@ -55,35 +276,56 @@ class Spring:
         # Liste des features à réafficher à la fin (pour éviter le scintillement)
         self._hidden_features = []
         
-        # Liste des LCS à réafficher à la fin
+        # Liste des LCS à réafficher à la fin (et leurs id pour le test d'appartenance)
         self._hidden_lcs = []
+        self._hidden_lcs_ids = set()
+        
+        # Construction groupée: un seul recompute du document à la fin
+        # (seuls les Shapes indispensables sont recalculés entre-temps)
+        self._batch = True
+        
+        # Une seule transaction pour toute la construction (une étape
+        # d'annulation); construction partielle annulée en cas d'erreur
+        doc = self.piece.Document
+        doc.openTransaction("SpringFull.build")
+        try:
+            self._build(data)
+        except Exception:
+            doc.abortTransaction()
+            raise
+        doc.commitTransaction()
         
+        # Replier le Body dans l'arbre
+        self._collapse_body()
+    
+    def _build(self, data):
+        """Construit le ressort (simplifié ou détaillé) dans la transaction de __init__."""
         # CORRECTION v1.2: Nettoyer les LCS dupliqués AVANT de commencer
         self._cleanup_duplicate_lcs()
         
         Gui.Selection.addSelection(self.piece)
         
         # Vérifier si représentation simplifiée demandée
-        if getattr(data, 'simplified', False):
+        if self._simplified:
             pad = self.create_simplified_cylinder(data)
             self.objects['Pad'] = pad
             self._show_all_features()  # Réafficher avant d'appliquer le matériau
             self._show_all_lcs()  # Réafficher les LCS
+            self._end_batch()  # Recompute unique: Shapes et visibilités redessinés ensemble
             self.apply_material_to_feature(data, pad, override_transparency=50.0)
         else:
             self.helixes(data)
-            self._recompute()
             self.Limits(data)
-            self._recompute()
+            self._update_progress("Recompute", force=True)  # Barre à jour avant le recompute final
             self._show_all_features()  # Réafficher avant d'appliquer le matériau
             self._show_all_lcs()  # Réafficher les LCS
+            self._end_batch()  # Recompute unique: Shapes et visibilités redessinés ensemble
             self.apply_material(data)
-        
-        # Replier le Body dans l'arbre
-        self._collapse_body()
     
     def _hide_feature(self, feature):
         """Masque une feature temporairement (pour éviter le scintillement)."""
+        if not self._has_gui:
+            return
         if feature and hasattr(feature, 'ViewObject') and feature.ViewObject:
             try:
                 feature.ViewObject.Visibility = False
@@ -91,8 +333,18 @@ class Spring:
             except:
                 pass
     
+    def _hide_features(self, *features):
+        """Masque plusieurs features en une passe (None ignorés)."""
+        if not self._has_gui:
+            return
+        for feature in features:
+            if feature is not None:
+                self._hide_feature(feature)
+    
     def _show_all_features(self):
         """Réaffiche toutes les features masquées."""
+        if not self._has_gui:
+            return
         for feature in self._hidden_features:
             try:
                 if feature and hasattr(feature, 'ViewObject') and feature.ViewObject:
@@ -103,70 +355,91 @@ class Spring:
     
     def _hide_lcs(self, lcs):
         """Masque un LCS temporairement en sauvegardant son état initial."""
+        if not self._has_gui:
+            return
         if lcs and hasattr(lcs, 'ViewObject') and lcs.ViewObject:
             try:
                 # Sauvegarder l'état initial (seulement si pas déjà dans la liste)
-                already_tracked = any(item[0] == lcs for item in self._hidden_lcs)
-                if not already_tracked:
+                if id(lcs) not in self._hidden_lcs_ids:
                     was_visible = lcs.ViewObject.Visibility
                     self._hidden_lcs.append((lcs, was_visible))
+                    self._hidden_lcs_ids.add(id(lcs))
                 # Masquer dans tous les cas
                 lcs.ViewObject.Visibility = False
-                App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_hidden').format(name=lcs.Name)}\n")
+                _log('console.lcs_hidden', name=lcs.Name)
             except Exception as e:
-                App.Console.PrintWarning(f"[SpringFull] {tr('console.error_lcs_hide').format(name=lcs.Name, error=e)}\n")
+                App.Console.PrintWarning(f"[SpringFull] {tr('console.error_lcs_hide', name=lcs.Name, error=e)}\n")
     
     def _show_all_lcs(self):
         """Restaure l'état de visibilité initial des LCS."""
-        doc = App.ActiveDocument
+        if not self._has_gui:
+            return
         for lcs, was_visible in self._hidden_lcs:
             try:
                 if lcs and hasattr(lcs, 'ViewObject') and lcs.ViewObject:
                     lcs.ViewObject.Visibility = was_visible
-                    App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_restored').format(name=lcs.Name, visible=was_visible)}\n")
+                    _log('console.lcs_restored', name=lcs.Name, visible=was_visible)
             except Exception as e:
-                App.Console.PrintWarning(f"[SpringFull] {tr('console.error_lcs_show').format(error=e)}\n")
+                App.Console.PrintWarning(f"[SpringFull] {tr('console.error_lcs_show', error=e)}\n")
         self._hidden_lcs.clear()
-        
-        # Forcer le rafraîchissement
-        if doc:
-            doc.recompute()
-        Gui.updateGui()
+        self._hidden_lcs_ids.clear()
+        # Pas de rafraîchissement forcé: le recompute est fait par _end_batch()
+        # et les changements de Visibility sont redessinés par la boucle Qt
     
     def _collapse_body(self):
         """Replie le Body dans l'arbre de modèle."""
+        if not self._has_gui:
+            return
         # QtCore et QtGui sont importés au niveau du module
         try:
-            if self.piece and Gui.ActiveDocument:
-                mw = Gui.getMainWindow()
-                if mw:
-                    # Chercher tous les QTreeWidget (le nom "treeWidget" ne fonctionne pas)
-                    trees = mw.findChildren(QtGui.QTreeWidget)
-                    if trees:
-                        tree = trees[0]
-                        # Chercher l'item correspondant au Body par son Label
-                        items = tree.findItems(
-                            self.piece.Label, 
-                            QtCore.Qt.MatchExactly | QtCore.Qt.MatchRecursive, 
-                            0
-                        )
-                        if items:
-                            tree.collapseItem(items[0])
+            if self.piece:
+                # Accès direct à l'item du Body (sans parcourir les widgets)
+                gui_doc = self._gui_doc
+                if hasattr(gui_doc, 'toggleTreeItem'):
+                    gui_doc.toggleTreeItem(self.piece, 1)  # 1 = replier
+                    return
+                tree = _get_tree_widget()
+                if tree:
+                    # Chercher l'item correspondant au Body par son Label
+                    items = tree.findItems(
+                        self.piece.Label, 
+                        QtCore.Qt.MatchExactly | QtCore.Qt.MatchRecursive, 
+                        0
+                    )
+                    if items:
+                        tree.collapseItem(items[0])
         except Exception as e:
-            App.Console.PrintWarning(f"[SpringFull] {tr('console.error_body_fold').format(error=e)}\n")
+            App.Console.PrintWarning(f"[SpringFull] {tr('console.error_body_fold', error=e)}\n")
     
-    def _update_progress(self, step_name):
-        """Met à jour le dialogue de progression."""
+    def _update_progress(self, step_name, force=False):
+        """
+        Met à jour le dialogue de progression.
+        force=True traite les événements sans délai (dernière étape avant
+        le recompute final, pour que la barre soit affichée à jour).
+        """
         if self.progress_dialog:
             self.progress_value += 12
             if self.progress_value > 90:
                 self.progress_value = 90
             self.progress_dialog.progress.setValue(self.progress_value)
+            # Traiter les événements au plus toutes les 50 ms (sauf si forcé)
+            now = time.monotonic()
+            if not force and now - self._last_progress_ts < _PROGRESS_EVENTS_INTERVAL:
+                return
+            self._last_progress_ts = now
             # QtGui est importé au niveau du module
             QtGui.QApplication.processEvents()
     
+    def _get_ground_ends(self, data):
+        """Extrémités meulées: True/False, None si extremeTurns est absent."""
+        if data is self.data:
+            return self._ground_ends  # Lu dans __init__
+        return _ground_ends(getattr(data, 'extremeTurns', None))
+    
     def _get_display_height(self, data):
         """Retourne la hauteur d'affichage (displayHeight si défini, sinon onLoadHight)."""
+        if data is self.data:
+            return self._display_height  # Lue dans __init__
         return getattr(data, 'displayHeight', data.onLoadHight)
     
     def _cleanup_duplicate_lcs(self):
@@ -181,38 +454,24 @@ class Spring:
         - Conserve celui avec le suffixe numérique le plus bas (l'original)
         - Supprime les autres (duplicats créés lors des changements de représentation)
         """
-        import re
-        
         # Collecter tous les LCS de ce Body par catégorie
         top_lcs_list = []
         bottom_lcs_list = []
         
-        for obj in self.piece.Group:
-            if obj.TypeId == 'PartDesign::CoordinateSystem':
-                name = obj.Name
-                # Identifier les LCS Top (contient "Local_Top" mais pas "Bottom")
-                if 'Local_Top' in name and 'Bottom' not in name:
-                    top_lcs_list.append(obj)
-                # Identifier les LCS Bottom
-                elif 'Local_Bottom' in name:
-                    bottom_lcs_list.append(obj)
-        
-        def extract_suffix_number(name, base_pattern):
-            """
-            Extrait le suffixe numérique d'un nom LCS.
-            Ex: 'Local_Top' → 0, 'Local_Top001' → 1, 'Local_Top_002' → 2
-            """
-            # Pattern pour capturer les chiffres après le nom de base
-            # Gère: Local_Top, Local_Top001, Local_Top_001, Local_Top_v2, etc.
-            match = re.search(base_pattern + r'[_]?(\d+)?$', name)
-            if match and match.group(1):
-                return int(match.group(1))
-            # Pas de suffixe numérique = c'est le premier (suffixe 0)
-            if re.match(base_pattern + r'$', name):
-                return 0
-            return float('inf')  # Nom non reconnu, mettre à la fin
-        
-        def get_primary_and_duplicates(lcs_list, base_pattern):
+        # Recherche par type côté C++, puis filtrage sur le Body parent
+        doc = self.piece.Document
+        for obj in doc.findObjects(Type='PartDesign::CoordinateSystem'):
+            if obj.getParentGeoFeatureGroup() != self.piece:
+                continue
+            name = obj.Name
+            # Identifier les LCS Top (Local_Top, Local_Top001, ...)
+            if name.startswith('Local_Top'):
+                top_lcs_list.append(obj)
+            # Identifier les LCS Bottom
+            elif name.startswith('Local_Bottom'):
+                bottom_lcs_list.append(obj)
+        
+        def get_primary_and_duplicates(lcs_list, base_name):
             """
             Identifie le LCS principal (à conserver) et les duplicats (à supprimer).
             Le LCS avec le suffixe le plus bas est considéré comme l'original.
@@ -223,14 +482,19 @@ class Spring:
             if len(lcs_list) == 1:
                 return lcs_list[0], []
             
-            # Trier par suffixe numérique (le plus petit = l'original)
-            sorted_lcs = sorted(lcs_list, key=lambda x: extract_suffix_number(x.Name, base_pattern))
+            # Trier par suffixe numérique (le plus petit = l'original);
+            # suffixe extrait une fois par LCS, position en départage (tri stable)
+            suffix_re, base_re = _LCS_NAME_PATTERNS[base_name]
+            ranked = sorted(
+                (_lcs_suffix_number(obj.Name, suffix_re, base_re), index, obj)
+                for index, obj in enumerate(lcs_list))
+            sorted_lcs = [obj for _, _, obj in ranked]
             
             return sorted_lcs[0], sorted_lcs[1:]
         
         # Identifier les LCS principaux et duplicats
-        primary_top, duplicates_top = get_primary_and_duplicates(top_lcs_list, r'Local_Top')
-        primary_bottom, duplicates_bottom = get_primary_and_duplicates(bottom_lcs_list, r'Local_Bottom')
+        primary_top, duplicates_top = get_primary_and_duplicates(top_lcs_list, 'Local_Top')
+        primary_bottom, duplicates_bottom = get_primary_and_duplicates(bottom_lcs_list, 'Local_Bottom')
         
         # Stocker les références aux LCS principaux pour réutilisation
         self._primary_top_lcs = primary_top
@@ -238,27 +502,26 @@ class Spring:
         
         # Masquer les LCS principaux existants pendant la reconstruction
         if primary_top:
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_top_main').format(name=primary_top.Name)}\n")
+            _log('console.lcs_top_main', name=primary_top.Name)
             self._hide_lcs(primary_top)
         if primary_bottom:
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_bottom_main').format(name=primary_bottom.Name)}\n")
+            _log('console.lcs_bottom_main', name=primary_bottom.Name)
             self._hide_lcs(primary_bottom)
         
         # Supprimer les duplicats
         duplicates = duplicates_top + duplicates_bottom
-        doc = App.ActiveDocument
-        
-        for obj in duplicates:
-            try:
-                App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_duplicate_deleted').format(name=obj.Name)}\n")
-                self.piece.removeObject(obj)
-                doc.removeObject(obj.Name)
-            except Exception as e:
-                App.Console.PrintWarning(f"[SpringFull] {tr('console.error_lcs_delete').format(name=obj.Name, error=e)}\n")
         
         if duplicates:
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_duplicates_deleted').format(count=len(duplicates))}\n")
-            doc.recompute()
+            # Suppressions dans la transaction de la construction (Spring.__init__)
+            # (doc.removeObject retire aussi l'objet du Group du Body)
+            for obj in duplicates:
+                try:
+                    _log('console.lcs_duplicate_deleted', name=obj.Name)
+                    doc.removeObject(obj.Name)
+                except Exception as e:
+                    App.Console.PrintWarning(f"[SpringFull] {tr('console.error_lcs_delete', name=obj.Name, error=e)}\n")
+            
+            _log('console.lcs_duplicates_deleted', count=len(duplicates))
     
     def _find_or_create_lcs(self, lcs_type, z_offset):
         """
@@ -280,17 +543,17 @@ class Spring:
         if lcs_type == 'top':
             if hasattr(self, '_primary_top_lcs') and self._primary_top_lcs is not None:
                 existing_lcs = self._primary_top_lcs
-                App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_reuse_top').format(name=existing_lcs.Name)}\n")
+                _log('console.lcs_reuse_top', name=existing_lcs.Name)
         elif lcs_type == 'bottom':
             if hasattr(self, '_primary_bottom_lcs') and self._primary_bottom_lcs is not None:
                 existing_lcs = self._primary_bottom_lcs
-                App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_reuse_bottom').format(name=existing_lcs.Name)}\n")
+                _log('console.lcs_reuse_bottom', name=existing_lcs.Name)
         
         # Étape 2: Si non trouvé, créer un nouveau LCS
         if existing_lcs is None:
             base_name = 'Local_Top' if lcs_type == 'top' else 'Local_Bottom'
             existing_lcs = self.piece.newObject('PartDesign::CoordinateSystem', base_name)
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.lcs_created').format(name=existing_lcs.Name)}\n")
+            _log('console.lcs_created', name=existing_lcs.Name)
             
             # Stocker la référence pour les appels suivants
             if lcs_type == 'top':
@@ -302,187 +565,157 @@ class Spring:
         self._hide_lcs(existing_lcs)
         
         # Configurer/mettre à jour le LCS
-        existing_lcs.AttachmentOffset = App.Placement(
+        # (propriétés écrites seulement si elles changent: chaque écriture
+        # notifie les objets dépendants)
+        offset = App.Placement(
             App.Vector(0, 0, z_offset),
-            App.Rotation(App.Vector(0, 0, 1), 0)
+            App.Rotation(_V_ZUP, 0)
         )
-        existing_lcs.MapReversed = False
-        existing_lcs.AttachmentSupport = [(self.piece.Origin.OriginFeatures[3], '')]  # XY_Plane
-        existing_lcs.MapPathParameter = 0.0
-        existing_lcs.MapMode = 'ObjectXY'
+        if existing_lcs.AttachmentOffset != offset:
+            existing_lcs.AttachmentOffset = offset
+        if existing_lcs.MapReversed:
+            existing_lcs.MapReversed = False
+        support = existing_lcs.AttachmentSupport
+        if not (len(support) == 1 and support[0][0] == self._xy_plane):
+            existing_lcs.AttachmentSupport = [(self._xy_plane, '')]
+        if existing_lcs.MapPathParameter != 0.0:
+            existing_lcs.MapPathParameter = 0.0
+        if existing_lcs.MapMode != 'ObjectXY':
+            existing_lcs.MapMode = 'ObjectXY'
         
         return existing_lcs
     
     def _recompute(self, force=False):
         """
         Recalcul sécurisé.
-        Le recompute est toujours effectué car nécessaire pour les Shapes.
+        Pendant la construction (self._batch), le recompute est différé
+        jusqu'à _end_batch(), sauf si force=True.
         """
-        doc = App.ActiveDocument
+        if self._batch and not force:
+            return
+        doc = self.piece.Document
         if doc:
             doc.recompute()
         else:
             App.Console.PrintWarning(f"[SpringFull] {tr('console.warn_no_active_doc')}\n")
     
+    def _recompute_objects(self, *objects):
+        """
+        Recalcule uniquement les objets donnés et leurs dépendances
+        (quand un Shape est nécessaire avant la fin de la construction).
+        """
+        doc = self.piece.Document
+        if doc:
+            doc.recompute(list(objects))
+        else:
+            App.Console.PrintWarning(f"[SpringFull] {tr('console.warn_no_active_doc')}\n")
+    
+    def _end_batch(self):
+        """Termine la construction groupée: recompute unique du document."""
+        self._batch = False
+        self._recompute()
+    
     @staticmethod
     def _read_material_properties(material_file_path, material_name):
         """
         Lit les propriétés matériau depuis le fichier JSON.
         Les couleurs sont dans le bloc 'color' de chaque matériau.
+        
+        Returns:
+            MaterialSpec: Propriétés du matériau (partagé par le cache)
         """
         try:
-            with open(material_file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            materials = config.get('materials', {})
-            metadata = config.get('metadata', {})
-            color_data = None
-            found_name = material_name
-            material_upper = material_name.strip().upper()
-            
-            for mat_name, mat_props in materials.items():
-                if mat_name.strip().upper() == material_upper:
-                    color_data = mat_props.get('color')
-                    found_name = mat_name
-                    break
-            
-            if color_data is None:
-                App.Console.PrintWarning(f"[SpringFull] {tr('console.warn_color_not_found').format(name=material_name)}\n")
-                color_data = metadata.get('default_color')
-                found_name = 'DEFAULT'
-                if color_data is None:
-                    return ("UNKNOWN MATERIAL", "(0.20, 0.20, 0.20)", "(0.29, 0.29, 0.29)",
-                            "(0.98, 0.98, 0.98)", "(0.00, 0.00, 0.00)", "0.02", "0.00")
-            
-            def list_to_str(lst):
-                return "({:.2f}, {:.2f}, {:.2f})".format(lst[0], lst[1], lst[2])
-            
-            diffuse = list_to_str(color_data.get('diffuse', [0.2, 0.2, 0.2]))
-            ambient = list_to_str(color_data.get('ambient', [0.29, 0.29, 0.29]))
-            specular = list_to_str(color_data.get('specular', [0.98, 0.98, 0.98]))
-            emissive = list_to_str(color_data.get('emissive', [0, 0, 0]))
-            shiny = str(color_data.get('shininess', 0.02))
-            transpar = str(color_data.get('transparency', 0.0))
-            
-            return (found_name, diffuse, ambient, specular, emissive, shiny, transpar)
-            
-        except Exception as e:
-            App.Console.PrintError(f"[SpringFull] {tr('console.error_material_read').format(error=str(e))}\n")
-            return ("UNKNOWN MATERIAL", "(0.20, 0.20, 0.20)", "(0.29, 0.29, 0.29)",
-                    "(0.98, 0.98, 0.98)", "(0.00, 0.00, 0.00)", "0.02", "0.00")
-    
-    @staticmethod
-    def _tupled(myStr):
-        """Convertit une chaîne "(r, g, b)" en tuple de floats"""
-        myStr = myStr.replace("(", "").replace(")", "").replace(",", " ")
-        return tuple(map(float, myStr.split()))
+            mtime = os.path.getmtime(material_file_path)
+        except OSError as e:
+            App.Console.PrintError(f"[SpringFull] {tr('console.error_material_read', error=e)}\n")
+            return _UNKNOWN_MATERIAL
+        return _read_material_cached(material_file_path, mtime, material_name)
     
     def apply_material_to_feature(self, data, feature, override_transparency=None):
         """Applique le matériau à une feature spécifique"""
         try:
-            thisMaterial, diffuse, ambient, specular, emissive, shiny, transpar = \
-                Spring._read_material_properties(data.materialsDatabase, data.material)
+            spec = Spring._read_material_properties(data.materialsDatabase, data.material)
             
-            final_transparency = override_transparency if override_transparency is not None else float(transpar)
+            final_transparency = override_transparency if override_transparency is not None else spec.transparency
             
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.material_on_feature').format(name=feature.Name)}\n")
+            _log('console.material_on_feature', name=feature.Name)
             
-            if feature and Gui.ActiveDocument:
-                view_provider = Gui.ActiveDocument.getObject(feature.Name)
+            # ViewObject direct (None en mode sans interface)
+            if feature:
+                view_provider = getattr(feature, 'ViewObject', None)
                 if view_provider:
-                    self._apply_material_to_view(view_provider, diffuse, ambient, specular, emissive, shiny, final_transparency)
+                    self._apply_material_to_view(view_provider, spec, final_transparency)
         except Exception as e:
-            App.Console.PrintWarning(f"[SpringFull] {tr('console.error_material_apply').format(error=str(e))}\n")
+            App.Console.PrintWarning(f"[SpringFull] {tr('console.error_material_apply', error=e)}\n")
     
     def apply_material(self, data, override_transparency=None):
         """Applique le matériau au Tip du Body et au Body lui-même"""
         try:
-            thisMaterial, diffuse, ambient, specular, emissive, shiny, transpar = \
-                Spring._read_material_properties(data.materialsDatabase, data.material)
+            spec = Spring._read_material_properties(data.materialsDatabase, data.material)
             
-            final_transparency = override_transparency if override_transparency is not None else float(transpar)
+            final_transparency = override_transparency if override_transparency is not None else spec.transparency
             
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.material_on_tip').format(name=self.piece.Tip.Name if self.piece.Tip else 'None')}\n")
+            _log('console.material_on_tip', name=self.piece.Tip.Name if self.piece.Tip else 'None')
             
-            if self.piece and Gui.ActiveDocument:
+            # ViewObject direct (None en mode sans interface)
+            if self.piece:
                 # Appliquer sur le Tip
-                if self.piece.Tip:
-                    view_obj = Gui.ActiveDocument.getObject(self.piece.Tip.Name)
+                tip = self.piece.Tip
+                if tip:
+                    view_obj = getattr(tip, 'ViewObject', None)
                     if view_obj:
-                        self._apply_material_to_view(view_obj, diffuse, ambient, specular, emissive, shiny, final_transparency)
+                        self._apply_material_to_view(view_obj, spec, final_transparency)
                 
                 # Appliquer aussi sur le Body (FreeCAD 1.1+)
-                body_view = Gui.ActiveDocument.getObject(self.piece.Name)
+                body_view = getattr(self.piece, 'ViewObject', None)
                 if body_view:
-                    self._apply_material_to_view(body_view, diffuse, ambient, specular, emissive, shiny, final_transparency)
+                    self._apply_material_to_view(body_view, spec, final_transparency)
                     
         except Exception as e:
-            App.Console.PrintWarning(f"[SpringFull] {tr('console.error_material_apply').format(error=str(e))}\n")
+            App.Console.PrintWarning(f"[SpringFull] {tr('console.error_material_apply', error=e)}\n")
     
-    def _apply_material_to_view(self, view_obj, diffuse, ambient, specular, emissive, shiny, transparency):
+    def _apply_material_to_view(self, view_obj, spec, transparency):
         """Applique le matériau à un ViewObject avec compatibilité FreeCAD 1.0/1.1"""
         try:
-            diffuse_tuple = Spring._tupled(diffuse)
-            ambient_tuple = Spring._tupled(ambient)
-            specular_tuple = Spring._tupled(specular)
-            emissive_tuple = Spring._tupled(emissive)
-            
             # Méthode 1: ShapeAppearance (FreeCAD 1.1+)
             if hasattr(view_obj, 'ShapeAppearance'):
                 # ShapeAppearance utilise une liste de Material
-                material = App.Material(
-                    DiffuseColor=diffuse_tuple,
-                    AmbientColor=ambient_tuple,
-                    SpecularColor=specular_tuple,
-                    EmissiveColor=emissive_tuple,
-                    Shininess=float(shiny),
-                    Transparency=transparency
-                )
-                view_obj.ShapeAppearance = [material]
-                App.Console.PrintMessage(f"[SpringFull] {tr('console.material_applied_appearance')}\n")
+                view_obj.ShapeAppearance = [_app_material(spec, transparency)]
+                _log('console.material_applied_appearance')
                 return
             
             # Méthode 2: ShapeMaterial (FreeCAD 1.0)
             if hasattr(view_obj, 'ShapeMaterial'):
-                view_obj.ShapeMaterial = App.Material(
-                    DiffuseColor=diffuse_tuple,
-                    AmbientColor=ambient_tuple,
-                    SpecularColor=specular_tuple,
-                    EmissiveColor=emissive_tuple,
-                    Shininess=float(shiny),
-                    Transparency=transparency
-                )
-                App.Console.PrintMessage(f"[SpringFull] {tr('console.material_applied_material')}\n")
+                view_obj.ShapeMaterial = _app_material(spec, transparency)
+                _log('console.material_applied_material')
                 return
             
             # Méthode 3: ShapeColor (fallback)
             if hasattr(view_obj, 'ShapeColor'):
-                view_obj.ShapeColor = diffuse_tuple
+                view_obj.ShapeColor = spec.diffuse
                 if hasattr(view_obj, 'Transparency'):
                     view_obj.Transparency = int(transparency * 100) if transparency < 1 else int(transparency)
-                App.Console.PrintMessage(f"[SpringFull] {tr('console.material_applied_color')}\n")
+                _log('console.material_applied_color')
                 return
                 
             App.Console.PrintWarning(f"[SpringFull] {tr('console.warn_no_material_property')}\n")
             
         except Exception as e:
-            App.Console.PrintWarning(f"[SpringFull] {tr('console.error_material_apply').format(error=e)}\n")
+            App.Console.PrintWarning(f"[SpringFull] {tr('console.error_material_apply', error=e)}\n")
     
     def helixes(self, data):
         """Création des hélices du ressort"""
-        # Vérification du document actif
-        if not App.ActiveDocument:
+        # Vérification du document du Body (utilisé explicitement par les
+        # recomputes: pas de changement de document actif)
+        if not self.piece.Document:
             raise Exception("Pas de document actif")
         
-        if self.piece.Document != App.ActiveDocument:
-            App.setActiveDocument(self.piece.Document.Name)
-        
         Helix.part = self.piece
         Helix.offsetY = data.offsetY
         
-        App.Console.PrintMessage(f"[SpringFull] {tr('console.creating_spring').format(name=self.piece.Name)}\n")
-        App.Console.PrintMessage(f"{tr('console.on_load_height').format(value=data.onLoadHight)}\n")
-        App.Console.PrintMessage(f"{tr('console.active_turns_height').format(value=data.activeTurnsHight)}\n")
+        _log('console.creating_spring', name=self.piece.Name)
+        _log_detail('console.on_load_height', value=data.onLoadHight)
+        _log_detail('console.active_turns_height', value=data.activeTurnsHight)
         
         # Hélice principale
         self._update_progress("MainHelix")
@@ -495,20 +728,16 @@ class Spring:
         if helix_mid.drawing:
             self.objects['MainSketch'] = helix_mid.drawing
         
-        self._recompute()
-        
         main_helix_obj = self.objects['MainHelix']
         
-        # Attendre que le Shape soit disponible
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            if main_helix_obj.Shape and main_helix_obj.Shape.Faces:
-                break
-            self._recompute()
-            time.sleep(0.1)
+        # Shape nécessaire pour les faces de base des hélices mortes:
+        # recompute ciblé (sketch + hélice), pas du document entier
+        self._recompute_objects(main_helix_obj)
         
+        # Le recompute est synchrone: sans Shape après lui, l'hélice est en erreur
         if not main_helix_obj.Shape or not main_helix_obj.Shape.Faces:
-            raise Exception("MainHelix Shape non disponible")
+            status = main_helix_obj.getStatusString() if hasattr(main_helix_obj, 'getStatusString') else ""
+            raise Exception(f"MainHelix Shape non disponible {status}".rstrip())
         
         # CORRECTION v1.3: Créer des hélices mortes SEULEMENT si deadTurnsQty > 0
         # Pour COUPEES et MEULEES (nm=0), pas d'hélices mortes
@@ -523,10 +752,10 @@ class Spring:
             grind_pitch = data.deadTurnsPitch
             grind_gap = 0
             
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.creating_dead_turns')}\n")
-            App.Console.PrintMessage(f"{tr('console.dead_turns_qty').format(value=data.deadTurnsQty)}\n")
-            App.Console.PrintMessage(f"{tr('console.grind_height').format(value=grind_height)}\n")
-            App.Console.PrintMessage(f"{tr('console.grind_pitch').format(value=grind_pitch)}\n")
+            _log('console.creating_dead_turns')
+            _log_detail('console.dead_turns_qty', value=data.deadTurnsQty)
+            _log_detail('console.grind_height', value=grind_height)
+            _log_detail('console.grind_pitch', value=grind_pitch)
             
             Helix.part = self.piece
             
@@ -551,23 +780,17 @@ class Spring:
             self.piece.Tip = helix_top.helix
         else:
             # Pas de spires mortes (COUPEES ou MEULEES)
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.no_dead_turns')}\n")
+            _log('console.no_dead_turns')
             self.piece.Tip = main_helix_obj
     
     def Limits(self, data):
         """Création des plans de limite pour meulage"""
-        needs_limits = False
-        if hasattr(data, 'extremeTurns'):
-            end_type_upper = data.extremeTurns.upper()
-            if 'MEULEES' in end_type_upper or 'MEULÉE' in end_type_upper:
-                needs_limits = True
-        
-        if not needs_limits:
-            App.Console.PrintMessage(f"[SpringFull] {tr('console.no_grinding')}\n")
+        if self._get_ground_ends(data) is not True:
+            _log('console.no_grinding')
             self.create_lcs_only(data)
             return
         
-        App.Console.PrintMessage(f"[SpringFull] {tr('console.grinding_required')}\n")
+        _log('console.grinding_required')
         
         # Utiliser la hauteur d'affichage pour le positionnement
         display_height = self._get_display_height(data)
@@ -583,7 +806,6 @@ class Spring:
         self._hide_feature(upper_plane)  # Masquer pour éviter le scintillement
         
         self.piece.Tip = upper_plane
-        self._recompute()
         
         self._update_progress("LowerPlane")
         lower_sketch, lower_plane, lower_lcs = self.create_limit_plane(
@@ -596,7 +818,6 @@ class Spring:
         self._hide_feature(lower_plane)  # Masquer pour éviter le scintillement
         
         self.piece.Tip = lower_plane
-        self._recompute()
     
     def create_limit_plane(self, data, sketch_name, plane_name, lcs_name, offset, reverse):
         """Crée un plan de limite (sketch + pocket + LCS)"""
@@ -606,87 +827,76 @@ class Spring:
         z_offset = offset if lcs_type == 'top' else 0
         lcs = self._find_or_create_lcs(lcs_type, z_offset)
         
-        self._recompute()
-        
         # Créer sketch
         sketch_obj = self.piece.newObject('Sketcher::SketchObject', sketch_name)
         sketch_obj.MapMode = 'FlatFace'
         sketch_obj.AttachmentSupport = [(lcs, '')]
         sketch_obj.AttachmentOffset = App.Placement(
-            App.Vector(0, 0, 0),
-            App.Rotation(App.Vector(0, 0, 1), 0)
+            _V_ORIGIN,
+            App.Rotation(_V_ZUP, 0)
         )
         
-        self._recompute()
-        
         sketch_obj.addGeometry(Part.Circle(
-            App.Vector(0, 0, 0),
-            App.Vector(0, 0, 1),
+            _V_ORIGIN,
+            _V_ZUP,
             data.externalDiameter / 2 * 1.5
         ), False)
         sketch_obj.addConstraint(Sketcher.Constraint('Coincident', 0, 3, -1, 1))
         sketch_obj.Visibility = False
         
-        self._recompute()
-        
         # Créer Pocket
         pocket = self.piece.newObject('PartDesign::Pocket', plane_name)
         pocket.Profile = sketch_obj
         pocket.Length = data.wireDiameter * 3
         pocket.Type = 0
         pocket.Reversed = reverse
-        # Compatibilité FreeCAD 1.0 (Midplane) et 1.1+ (SideType)
-        if hasattr(pocket, 'SideType'):
-            pocket.SideType = 'One side'  # FreeCAD 1.1+
-        elif hasattr(pocket, 'Midplane'):
-            pocket.Midplane = 0  # FreeCAD 1.0
+        _set_one_side(pocket)
         pocket.UseCustomVector = 0
         
-        self._recompute()
+        # Pas de recompute ici: le Pocket (et son sketch attaché au LCS) est
+        # calculé par le recompute final de la construction (_end_batch)
         
         return (sketch_obj, pocket, lcs)
     
+    def _create_end_lcs(self, display_height):
+        """Trouve ou crée les deux LCS d'extrémité (haut puis bas) en une passe."""
+        for lcs_type, key, z_offset in (('top', 'Local_Top', display_height),
+                                        ('bottom', 'Local_Bottom', 0)):
+            self.objects[key] = self._find_or_create_lcs(lcs_type, z_offset)
+    
     def create_lcs_only(self, data):
         """Crée uniquement les LCS sans plans de limite"""
         # CORRECTION v1.4: Utiliser displayHeight pour le positionnement
-        display_height = self._get_display_height(data)
-        lcs_top = self._find_or_create_lcs('top', display_height)
-        lcs_bottom = self._find_or_create_lcs('bottom', 0)
-        
-        self.objects['Local_Top'] = lcs_top
-        self.objects['Local_Bottom'] = lcs_bottom
-        
-        self._recompute()
+        self._create_end_lcs(self._get_display_height(data))
     
     def create_simplified_cylinder(self, data):
-        """Crée la représentation simplifiée (tube creux)"""
-        App.Console.PrintMessage(f"[SpringFull] {tr('console.creating_simplified')}\n")
+        """
+        Crée la représentation simplifiée (tube creux).
+        
+        Construit dans le lot de Spring.__init__: seul le Pad peut être
+        recalculé (pour lire ses arêtes), le reste l'est par le recompute final.
+        """
+        _log('console.creating_simplified')
         
         sketch = self.piece.newObject('Sketcher::SketchObject', 'TubeSketch')
-        sketch.AttachmentSupport = [(self.piece.Origin.OriginFeatures[3], '')]
+        sketch.AttachmentSupport = [(self._xy_plane, '')]
         sketch.MapMode = 'FlatFace'
         self.objects['TubeSketch'] = sketch
         
-        self._recompute()
-        
         ext_radius = data.externalDiameter / 2
         internal_diameter = data.meanDiameter - data.wireDiameter
         int_radius = internal_diameter / 2
         
-        sketch.addGeometry(Part.Circle(
-            App.Vector(0, 0, 0),
-            App.Vector(0, 0, 1),
-            ext_radius
-        ), False)
-        
-        sketch.addGeometry(Part.Circle(
-            App.Vector(0, 0, 0),
-            App.Vector(0, 0, 1),
-            int_radius
-        ), False)
+        # Cercles et contraintes ajoutés en une fois (une seule résolution du sketch)
+        geo_ids = sketch.addGeometry([
+            Part.Circle(_V_ORIGIN, _V_ZUP, ext_radius),
+            Part.Circle(_V_ORIGIN, _V_ZUP, int_radius),
+        ], False)
         
-        sketch.addConstraint(Sketcher.Constraint('Coincident', 0, 3, -1, 1))
-        sketch.addConstraint(Sketcher.Constraint('Coincident', 1, 3, -1, 1))
+        sketch.addConstraint([
+            Sketcher.Constraint('Coincident', geo_ids[0], 3, -1, 1),
+            Sketcher.Constraint('Coincident', geo_ids[1], 3, -1, 1),
+        ])
         sketch.Visibility = False
         
         # CORRECTION v1.4: Utiliser displayHeight pour la longueur du tube
@@ -697,54 +907,50 @@ class Spring:
         pad.Length = display_height
         pad.Type = 'Length'
         pad.Reversed = False
-        # Compatibilité FreeCAD 1.0 (Midplane) et 1.1+ (SideType)
-        if hasattr(pad, 'SideType'):
-            pad.SideType = 'One side'  # FreeCAD 1.1+
-        elif hasattr(pad, 'Midplane'):
-            pad.Midplane = False  # FreeCAD 1.0
+        _set_one_side(pad)
         
         self.objects['Pad'] = pad
-        self._hide_feature(pad)  # Masquer pour éviter le scintillement
         self.piece.Tip = pad
-        self._recompute()
         
         # Fillets pour extrémités non meulées
-        needs_fillets = False
-        if hasattr(data, 'extremeTurns'):
-            end_type_upper = data.extremeTurns.upper()
-            if 'MEULEES' not in end_type_upper and 'MEULÉE' not in end_type_upper:
-                needs_fillets = True
-        
-        if needs_fillets:
+        if self._get_ground_ends(data) is False:
             fillet_radius = (data.wireDiameter / 2) - 0.001
             try:
                 fillet = self.piece.newObject('PartDesign::Fillet', 'EndFillets')
-                edges_to_fillet = []
-                for i, edge in enumerate(pad.Shape.Edges):
-                    if hasattr(edge.Curve, 'Radius'):
-                        edges_to_fillet.append("Edge" + str(i+1))
+                # Arêtes circulaires du tube: mémorisées par géométrie, le Pad
+                # n'est recalculé (pour lire ses arêtes) qu'à la première fois
+                tube_key = (ext_radius, int_radius, display_height)
+                edges_to_fillet = _TUBE_FILLET_EDGES.get(tube_key)
+                if edges_to_fillet is None:
+                    self._recompute_objects(pad)
+                    edges_to_fillet = [f"Edge{i}" for i, edge in enumerate(pad.Shape.Edges, 1)
+                                       if type(edge.Curve) is Part.Circle]
+                    if edges_to_fillet:
+                        if len(_TUBE_FILLET_EDGES) >= _TUBE_FILLET_EDGES_MAX:
+                            # Retirer la géométrie la plus ancienne (ordre d'insertion)
+                            del _TUBE_FILLET_EDGES[next(iter(_TUBE_FILLET_EDGES))]
+                        _TUBE_FILLET_EDGES[tube_key] = edges_to_fillet
                 
                 if edges_to_fillet:
                     fillet.Base = (pad, edges_to_fillet)
                     fillet.Radius = fillet_radius
                     self.objects['Fillet'] = fillet
-                    self._hide_feature(fillet)  # Masquer pour éviter le scintillement
                     self.piece.Tip = fillet
-                    self._recompute()
             except Exception as e:
-                App.Console.PrintWarning(f"[SpringFull] {tr('console.error_fillets').format(error=str(e))}\n")
+                App.Console.PrintWarning(f"[SpringFull] {tr('console.error_fillets', error=e)}\n")
+        
+        # Masquage groupé une fois le Tip définitif (pour éviter le scintillement):
+        # aucun traitement d'événements Qt n'a eu lieu depuis leur création
+        self._hide_features(pad, self.objects.get('Fillet'))
         
-        # LCS - CORRECTION v1.4: Utiliser displayHeight
-        self._create_simplified_lcs(data)
+        # LCS - CORRECTION v1.4: Utiliser displayHeight (déjà lue pour le Pad)
+        self._create_simplified_lcs(data, display_height)
         
         return self.piece.Tip
     
-    def _create_simplified_lcs(self, data):
+    def _create_simplified_lcs(self, data, display_height=None):
         """Crée les LCS pour la représentation simplifiée"""
         # CORRECTION v1.4: Utiliser displayHeight pour le positionnement
-        display_height = self._get_display_height(data)
-        lcs_top = self._find_or_create_lcs('top', display_height)
-        lcs_bottom = self._find_or_create_lcs('bottom', 0)
-        
-        self.objects['Local_Top'] = lcs_top
-        self.objects['Local_Bottom'] = lcs_bottom
+        if display_height is None:
+            display_height = self._get_display_height(data)
+        self._create_end_lcs(display_height)
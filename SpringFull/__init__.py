@@ -30,5 +30,6 @@ Version: 1.4.2 - Modifications:
 """
 
 __version__ = "1.4.2"
+__version_info__ = tuple(int(part) for part in __version__.split("."))  # (1, 4, 2)
 __author__ = "Yves Guillou"
 __licence__ = "GPL"